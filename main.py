@@ -1,19 +1,38 @@
+import io
 import os
 import sys
 import glob
-from datetime import datetime
+import json
+import uuid
+import time
+import signal
+import asyncio
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 import requests
-import pandas as pd
+import aiohttp
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-import matplotlib.font_manager as fm
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from matplotlib.text import Text
 import numpy as np
 
 from utils.logger_util import LoggerUtil
 from utils.telegram_util import TelegramUtil
 from utils.db_util import DatabaseUtil
+from utils.chart_util import ChartContext, LiveChart, LiveChartCache, make_background_key
+from utils.chart_cache_util import ChartCache
+from utils.chart_render_util import ChartRenderService
+from utils.http_util import HttpUtil
+from utils.rate_limit_util import RateLimiter
+from utils.retry_util import RetryPolicy, CircuitBreaker, CircuitOpenError, ApiStats
 
 # 환경변수 로드
 load_dotenv()
@@ -25,6 +44,137 @@ logger = LoggerUtil().get_logger()
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = f"{PROJECT_ROOT}/data"
 DB_PATH = f"{DATA_DIR}/bithumb_price_monitor.db"
+CHART_FONT_PATH = f"{PROJECT_ROOT}/fonts/NotoSansKR-Regular.ttf"
+
+# 한국 표준시 (빗썸 일봉 기준 시간대)
+KST = timezone(timedelta(hours=9))
+
+# DB에 유지할 일봉 이력 일수 (늘리면 다음 실행 시 부족한 과거 구간만 추가 백필)
+HISTORY_DAYS = max(1, int(os.getenv('HISTORY_DAYS', '365')))
+
+# 현재가 일괄 조회 시 요청당 최대 마켓 수 (URL 길이 제한 대응)
+TICKER_CHUNK_SIZE = 100
+
+# 종목 처리 동시 실행 워커 수 (1이면 순차 처리)
+MAX_WORKERS = max(1, int(os.getenv('MAX_WORKERS', '1')))
+
+# 이력 백필 동시 실행 워커 수 (요청 속도는 BITHUMB_RATE_LIMIT로 전역 제한)
+BACKFILL_WORKERS = max(1, int(os.getenv('BACKFILL_WORKERS', '4')))
+
+# 공용 HTTP 세션 (keep-alive 연결 풀, 백필이 모니터링과 동시에 빗썸을 호출하므로 두 워커 수의 합만큼 연결 유지)
+http_session = HttpUtil(pool_size=MAX_WORKERS + BACKFILL_WORKERS).get_session()
+
+# 이력 백필 연결이 모니터링 사이클의 쓰기 트랜잭션(알림 전송 포함) 종료를 기다릴 최대 시간 (초)
+BACKFILL_BUSY_TIMEOUT = 120
+
+# SQLite 내구성 프로파일 (safe / balanced / fast, 설명은 utils/db_util.py 참고)
+DB_DURABILITY = os.getenv('DB_DURABILITY', 'balanced')
+
+# 스트리밍 모드 DB 커밋 주기 (초, ticker마다 커밋하지 않고 모아서 커밋)
+STREAM_COMMIT_INTERVAL = 1
+
+# 데몬 모드 모니터링 주기 (초, 1분 미만 가능, 최소 1초)
+POLL_INTERVAL_SECONDS = max(1.0, float(os.getenv('POLL_INTERVAL_SECONDS', '60')))
+
+# 상주 모드(daemon/stream) 종목별 최근 일봉 캐시 최대 행 수 (전 종목 합산, 0이면 사용 안 함)
+# 미설정 시 종목당 CANDLE_CACHE_ROWS_PER_SYMBOL행 (차트/이동평균용 365일 조회 구간 + 기준일)
+CANDLE_CACHE_MAX_ROWS = os.getenv('CANDLE_CACHE_MAX_ROWS') or None
+CANDLE_CACHE_ROWS_PER_SYMBOL = 366
+
+# 장중 체결가 기록 보존 기간 (원본 체결가는 시간, 1분/1시간 봉은 일 단위, 지나면 봉으로 압축 후 삭제)
+TICK_RETENTION_HOURS = max(1, int(os.getenv('TICK_RETENTION_HOURS', '24')))
+MINUTE_BAR_RETENTION_DAYS = max(1, int(os.getenv('MINUTE_BAR_RETENTION_DAYS', '30')))
+HOUR_BAR_RETENTION_DAYS = max(1, int(os.getenv('HOUR_BAR_RETENTION_DAYS', '365')))
+
+# 상주 모드(daemon/stream) 체결가 압축 주기 (초)
+TICK_COMPACT_INTERVAL = 600
+
+# 스트리밍 모드 날짜 변경(증분 백필 재실행) 확인 주기 (초, 데몬 모드는 사이클마다 확인)
+BACKFILL_CHECK_INTERVAL = 60
+
+# 차트 이미지를 data/ 디렉토리에도 저장할지 여부 (기본: 메모리에서 바로 업로드)
+CHART_SAVE_TO_DISK = os.getenv('CHART_SAVE_TO_DISK', 'false').lower() == 'true'
+
+# 차트 렌더링 옵션 (차트 캐시 키에 포함되므로 차트 모양을 바꾸는 값은 여기에 추가)
+CHART_OPTIONS = {
+    'display_days': 120,
+    'figratio': (10, 7),
+    'dpi': 100,
+    'candle_width': 0.6,
+    'candle_linewidth': 0.8,
+    'volume_width': 0.6
+}
+
+# 차트 이동평균선 기간(일)과 색상
+CHART_MA_COLORS = {
+    5: '#2ca02c',   # Green
+    20: '#d62728',  # Red
+    60: '#ff7f0e',  # Orange
+    120: '#9467bd'  # Purple
+}
+
+# 상주 모드(daemon/stream) 차트 렌더링 워커 프로세스 수 (0이면 알림 처리 스레드에서 직접 렌더링)
+CHART_RENDER_WORKERS = max(0, int(os.getenv('CHART_RENDER_WORKERS', '2')))
+
+# 차트 렌더링 최대 대기 수 (초과 시 차트 없이 텍스트만 전송) 및 렌더링 결과 대기 시간 (초)
+CHART_RENDER_MAX_PENDING = max(1, int(os.getenv('CHART_RENDER_MAX_PENDING', '8')))
+CHART_RENDER_TIMEOUT = 60
+
+# 증분 렌더링용 차트 배경 최대 보관 종목 수 (종목당 figure 1개, 0이면 매번 전체 렌더링)
+CHART_BACKGROUND_CACHE_SIZE = max(0, int(os.getenv('CHART_BACKGROUND_CACHE_SIZE', '0')))
+
+# 차트 이미지 캐시 최대 개수 (0이면 사용 안 함) 및 보관 시간 (초, 같은 입력이면 이 시간 동안 재사용)
+CHART_CACHE_MAX_ENTRIES = max(0, int(os.getenv('CHART_CACHE_MAX_ENTRIES', '64')))
+CHART_CACHE_TTL_SECONDS = max(1, int(os.getenv('CHART_CACHE_TTL_SECONDS', '300')))
+
+# 알림 메시지에 표시할 기간별 최고가/최저가 기간 (일, DB 요약 테이블 기간과 동일)
+ALERT_PERIODS = sorted({int(days) for days in os.getenv('ALERT_PERIODS', '5,20,60,120').split(',')})
+
+# 비동기 모드 동시 요청 수 상한
+ASYNC_CONCURRENCY = max(1, int(os.getenv('ASYNC_CONCURRENCY', '50')))
+
+# HTTP 요청 타임아웃 (초)
+REQUEST_TIMEOUT = 10
+
+# 빗썸 API 시도당 타임아웃 (초, 타임아웃된 시도도 RETRY_POLICY 예산 안에서 재시도되도록 예산보다 짧게)
+BITHUMB_REQUEST_TIMEOUT = 3
+
+# 빗썸 공개 웹소켓 주소 및 재연결 대기 시간 (초, 실패 시 최대값까지 2배씩 증가)
+BITHUMB_WS_URL = os.getenv('BITHUMB_WS_URL', 'wss://ws-api.bithumb.com/websocket/v1')
+WS_RECONNECT_MIN_DELAY = 1
+WS_RECONNECT_MAX_DELAY = 30
+
+# 빗썸 API 초당 요청 수 제한 및 429 응답 시 최대 재시도 횟수
+BITHUMB_RATE_LIMIT = float(os.getenv('BITHUMB_RATE_LIMIT', '10'))
+RATE_LIMIT_MAX_RETRIES = 3
+
+# 빗썸 API 비동기 요청용 시도당 타임아웃
+BITHUMB_REQUEST_TIMEOUT_ASYNC = aiohttp.ClientTimeout(total=BITHUMB_REQUEST_TIMEOUT)
+
+# 빗썸 API 호출 공용 속도 제한 (모든 스레드/코루틴이 공유)
+bithumb_limiter = RateLimiter(BITHUMB_RATE_LIMIT)
+
+# 빗썸 API 장애 대응: 연결 오류/타임아웃/5xx 재시도 (최대 3회 시도, 첫 시도부터 전체 예산 10초)
+# 시도당 타임아웃 3초이므로 타임아웃이 두 번 나도 세 번째 시도까지 예산 안에 들어감
+RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=0.2, max_delay=2.0, budget=10.0)
+
+# 호스트별 회로 차단기: 연속 실패 N회 시 일정 시간 동안 요청 없이 즉시 실패
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RESET_SECONDS = float(os.getenv('CIRCUIT_RESET_SECONDS', '30'))
+circuit_breakers = {}
+circuit_breakers_lock = threading.Lock()
+
+# API 호출 통계 (요청/성공/실패/재시도/차단 횟수)
+api_stats = ApiStats()
+
+# 차트 이미지 캐시 (모든 스레드가 공유)
+chart_cache = ChartCache(CHART_CACHE_MAX_ENTRIES, CHART_CACHE_TTL_SECONDS) if CHART_CACHE_MAX_ENTRIES > 0 else None
+
+# 차트 렌더링 프로세스 풀 (상주 모드에서 start_chart_renderer로 시작)
+chart_renderer = None
+
+# 종목별 차트 배경 (증분 렌더링, ChartContext.render_lock 안에서만 사용)
+live_charts = LiveChartCache(CHART_BACKGROUND_CACHE_SIZE)
 
 # 디렉토리 생성
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -55,13 +205,247 @@ def validate_env():
         sys.exit(1)
 
 
-def get_daily_candles(symbol, count=120):
+def parse_daily_candle(candle):
+    """
+    일봉 캔들 API 응답 1건을 캔들 데이터 형식으로 변환
+
+    Args:
+        candle: /v1/candles/days 응답 배열의 원소
+
+    Returns:
+        dict: 캔들 데이터 (get_latest_daily_candle 반환 형식)
+    """
+    return {
+        'opening_price': float(candle['opening_price']),
+        'trade_price': float(candle['trade_price']),
+        'high_price': float(candle['high_price']),
+        'low_price': float(candle['low_price']),
+        'candle_acc_trade_volume': float(candle['candle_acc_trade_volume']),
+        'candle_date_time_kst': candle['candle_date_time_kst'],
+        'trade_timestamp': candle.get('timestamp')
+    }
+
+
+def parse_ticker(ticker):
+    """
+    현재가 API 응답 1건을 일봉 캔들 데이터 형식으로 변환
+
+    Args:
+        ticker: /v1/ticker 응답 배열의 원소
+
+    Returns:
+        tuple: (symbol, 캔들 데이터) - 날짜는 KST 기준
+    """
+    symbol = ticker['market'].split('-', 1)[1]
+    trade_date = ticker['trade_date_kst']
+
+    return symbol, {
+        'opening_price': float(ticker['opening_price']),
+        'trade_price': float(ticker['trade_price']),
+        'high_price': float(ticker['high_price']),
+        'low_price': float(ticker['low_price']),
+        'candle_acc_trade_volume': float(ticker['acc_trade_volume']),
+        'candle_date_time_kst': f"{trade_date[:4]}-{trade_date[4:6]}-{trade_date[6:8]} 00:00:00",
+        'trade_timestamp': ticker.get('trade_timestamp')
+    }
+
+
+def get_monitored_symbols():
+    """환경변수(MONITORED_SYMBOLS)에서 모니터링 코인 목록 조회"""
+    monitored_symbols = os.getenv('MONITORED_SYMBOLS').split(',')
+    return [s.strip().upper() for s in monitored_symbols]
+
+
+def get_candle_cache_max_rows(monitored_symbols):
+    """일봉 캐시 최대 행 수 (CANDLE_CACHE_MAX_ROWS 미설정 시 종목 수 x 종목당 조회 구간 행 수)"""
+    if CANDLE_CACHE_MAX_ROWS is None:
+        return CANDLE_CACHE_ROWS_PER_SYMBOL * len(monitored_symbols)
+    return max(0, int(CANDLE_CACHE_MAX_ROWS))
+
+
+def get_retry_after(headers, attempt):
+    """
+    429 응답 후 대기 시간(초) 계산
+
+    Retry-After 헤더가 있으면 그 값을, 없으면 0.5초부터 지수적으로 증가
+    """
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return 0.5 * (2 ** attempt)
+
+
+def get_circuit_breaker(host):
+    """호스트별 회로 차단기 조회 (없으면 생성)"""
+    with circuit_breakers_lock:
+        if host not in circuit_breakers:
+            circuit_breakers[host] = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+        return circuit_breakers[host]
+
+
+def record_request_failure(host, breaker, error, failures, started_at):
+    """
+    재시도 대상 실패 기록 후 재시도 대기 시간 계산
+
+    Returns:
+        float: 재시도 전 대기 시간(초), 재시도하지 않으면 None
+    """
+    api_stats.record(host, 'failures')
+    if breaker.record_failure():
+        logger.error(f"{host} 연속 실패로 회로 차단 ({CIRCUIT_RESET_SECONDS:.0f}초간 요청 중단)")
+
+    # 회로가 열려 있으면 재시도 없이 바로 실패
+    if breaker.state == CircuitBreaker.OPEN:
+        return None
+
+    delay = RETRY_POLICY.get_delay(failures - 1)
+    if not RETRY_POLICY.can_retry(failures, started_at, delay):
+        return None
+
+    api_stats.record(host, 'retries')
+    logger.warning(f"빗썸 API 요청 실패 ({str(error)}) - {delay:.2f}초 후 재시도 ({failures}/{RETRY_POLICY.max_attempts - 1})")
+    return delay
+
+
+def log_api_stats():
+    """API 호출 통계 및 회로 차단기 상태 로그"""
+    for host, counts in api_stats.snapshot().items():
+        state = get_circuit_breaker(host).state
+        logger.info(
+            f"API 상태 [{host}] 회로: {state}, 요청: {counts['requests']}, 성공: {counts['successes']}, "
+            f"실패: {counts['failures']}, 재시도: {counts['retries']}, 차단: {counts['short_circuited']}"
+        )
+
+
+def log_cache_stats(db):
+    """일봉/차트 캐시 및 차트 렌더링 워커 상태 로그 (사용 시)"""
+    cache = db.candle_cache
+    if cache is not None:
+        logger.info(
+            f"일봉 캐시: 종목 {len(cache.entries)}개, {cache.row_count}/{cache.max_rows}행, "
+            f"적중: {cache.hits}, 미적중: {cache.misses}"
+        )
+
+    if live_charts.hits + live_charts.misses:
+        logger.info(
+            f"차트 배경: {len(live_charts.entries)}/{live_charts.max_entries}개, "
+            f"재사용: {live_charts.hits}, 생성: {live_charts.misses}"
+        )
+
+    if chart_renderer is not None:
+        logger.info(
+            f"차트 렌더링 워커: 대기 {chart_renderer.pending}/{chart_renderer.max_pending}개, "
+            f"요청: {chart_renderer.submitted}, 생략: {chart_renderer.shed}"
+        )
+
+    if chart_cache is not None and chart_cache.hits + chart_cache.misses:
+        logger.info(
+            f"차트 캐시: {len(chart_cache.entries)}/{chart_cache.max_entries}개, "
+            f"적중: {chart_cache.hits}, 미적중: {chart_cache.misses}, 적중률: {chart_cache.hit_rate:.1%}"
+        )
+
+
+def request_bithumb(url, params):
+    """
+    빗썸 API GET 요청 (전역 속도 제한 + 재시도 + 회로 차단)
+
+    - 모든 빗썸 호출은 bithumb_limiter를 거침
+    - HTTP 429: limiter 전체를 backoff 시킨 뒤 재시도 (최대 RATE_LIMIT_MAX_RETRIES회)
+    - 연결 오류/타임아웃/응답 끊김/5xx: RETRY_POLICY에 따라 지터 백오프 후 재시도 (지연 예산 이내)
+    - 그 밖의 예외도 회로 차단기에 실패로 기록 후 그대로 발생
+    - 호스트별 회로 차단기가 열려 있으면 요청 없이 CircuitOpenError 발생
+
+    Returns:
+        JSON 응답
+    """
+    headers = {"accept": "application/json"}
+    host = urlparse(url).netloc
+    breaker = get_circuit_breaker(host)
+    started_at = time.monotonic()
+    failures = 0
+    rate_limited = 0
+
+    while True:
+        if not breaker.allow_request():
+            api_stats.record(host, 'short_circuited')
+            raise CircuitOpenError(host)
+
+        bithumb_limiter.acquire()
+        api_stats.record(host, 'requests')
+
+        try:
+            response = http_session.get(url, params=params, headers=headers, timeout=BITHUMB_REQUEST_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            error = e
+        except BaseException:
+            # 그 밖의 예외도 실패로 기록 (half_open 시험 요청이 결과 없이 끝나지 않도록)
+            api_stats.record(host, 'failures')
+            breaker.record_failure()
+            raise
+        else:
+            if response.status_code == 429 and rate_limited < RATE_LIMIT_MAX_RETRIES:
+                # 속도 제한은 장애가 아니므로 회로 차단기에는 정상 응답으로 기록
+                breaker.record_success()
+                delay = get_retry_after(response.headers, rate_limited)
+                rate_limited += 1
+                api_stats.record(host, 'retries')
+                logger.warning(f"빗썸 API 요청 한도 초과(429) - {delay:.1f}초 후 재시도")
+                bithumb_limiter.backoff(delay)
+                continue
+
+            if response.status_code < 500:
+                # 4xx는 재시도해도 같은 결과이므로 바로 예외 발생
+                breaker.record_success()
+                if not response.ok:
+                    api_stats.record(host, 'failures')
+                response.raise_for_status()
+                api_stats.record(host, 'successes')
+                return response.json()
+
+            error = requests.HTTPError(f"{response.status_code} Server Error: {url}", response=response)
+
+        failures += 1
+        delay = record_request_failure(host, breaker, error, failures, started_at)
+        if delay is None:
+            raise error
+        time.sleep(delay)
+
+
+def parse_ws_ticker(message):
+    """
+    웹소켓 ticker 메시지를 일봉 캔들 데이터 형식으로 변환
+
+    Args:
+        message: 웹소켓 ticker 메시지 (type='ticker')
+
+    Returns:
+        tuple: (symbol, 캔들 데이터) - 날짜는 KST 기준
+            (웹소켓 trade_date는 UTC이므로 체결 시각(trade_timestamp, epoch 밀리초)을 KST로 변환)
+    """
+    symbol = message['code'].split('-', 1)[1]
+    trade_date = datetime.fromtimestamp(message['trade_timestamp'] / 1000, KST).strftime('%Y-%m-%d')
+
+    return symbol, {
+        'opening_price': float(message['opening_price']),
+        'trade_price': float(message['trade_price']),
+        'high_price': float(message['high_price']),
+        'low_price': float(message['low_price']),
+        'candle_acc_trade_volume': float(message['acc_trade_volume']),
+        'candle_date_time_kst': f"{trade_date} 00:00:00",
+        'trade_timestamp': message.get('trade_timestamp')
+    }
+
+
+def get_daily_candles(symbol, count=120, to=None, allow_partial=True):
     """
     빗썸 일봉 캔들 데이터 조회 (다중 호출 지원)
 
     Args:
         symbol: 'BTC', 'XRP', 'ETH'
         count: 조회할 캔들 개수 (200 이상도 가능, 자동 다중 호출)
+        to: 'YYYY-MM-DD HH:MM:SS' - 이 시각 이전 캔들부터 조회 (None이면 최신부터)
+        allow_partial: 중간 호출 실패 시 그때까지 받은 데이터 반환 여부
+            (False면 None 반환 - count보다 적게 반환되면 거래소 데이터가 끝난 것으로 판단 가능)
 
     Returns:
         list: 캔들 데이터 리스트 (최신→과거 순서)
@@ -76,16 +460,13 @@ def get_daily_candles(symbol, count=120):
                 },
                 ...
             ]
-        실패 시 None
+        실패 시 None (allow_partial=False면 중간 호출 실패 시에도 None)
     """
-    import time
-
     url = f"https://api.bithumb.com/v1/candles/days"
-    headers = {"accept": "application/json"}
 
     all_candles = []
     remaining_count = count
-    to_timestamp = None  # 첫 호출은 None (최신 데이터)
+    to_timestamp = to  # 첫 호출이 None이면 최신 데이터
 
     try:
         while remaining_count > 0:
@@ -104,9 +485,7 @@ def get_daily_candles(symbol, count=120):
 
             # API 호출
             logger.info(f"[{symbol}] API 호출: count={batch_size}, to={to_timestamp or '최신'}")
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = request_bithumb(url, params)
 
             # 응답 검증
             if not isinstance(data, list):
@@ -119,16 +498,7 @@ def get_daily_candles(symbol, count=120):
                 break
 
             # 캔들 데이터 변환
-            batch_candles = []
-            for candle in data:
-                batch_candles.append({
-                    'opening_price': float(candle['opening_price']),
-                    'high_price': float(candle['high_price']),
-                    'low_price': float(candle['low_price']),
-                    'trade_price': float(candle['trade_price']),
-                    'candle_acc_trade_volume': float(candle['candle_acc_trade_volume']),
-                    'candle_date_time_kst': candle['candle_date_time_kst']
-                })
+            batch_candles = [parse_daily_candle(candle) for candle in data]
 
             # 배치 추가
             all_candles.extend(batch_candles)
@@ -138,20 +508,17 @@ def get_daily_candles(symbol, count=120):
             oldest_candle = data[-1]
             to_timestamp = oldest_candle['candle_date_time_kst']
 
-            # 남은 개수 갱신
+            # 남은 개수 갱신 (API Rate Limit은 request_bithumb에서 대응)
             remaining_count -= len(batch_candles)
 
-            # API Rate Limit 대응 (0.5초 대기)
-            if remaining_count > 0:
-                time.sleep(0.5)
-                logger.info(f"[{symbol}] 다음 배치 대기... (남은: {remaining_count}개)")
-
         logger.info(f"[{symbol}] 일봉 캔들 {len(all_candles)}개 조회 완료")
         return all_candles
 
     except Exception as e:
         logger.error(f"[{symbol}] 일봉 캔들 조회 실패: {str(e)}")
         # 부분 데이터라도 반환
+        if not allow_partial:
+            return None
         return all_candles if len(all_candles) > 0 else None
 
 
@@ -169,7 +536,8 @@ def get_latest_daily_candle(symbol):
             'high_price': float,
             'low_price': float,
             'candle_acc_trade_volume': float,
-            'candle_date_time_kst': 'YYYY-MM-DD HH:MM:SS'
+            'candle_date_time_kst': 'YYYY-MM-DD HH:MM:SS',
+            'trade_timestamp': int (마지막 체결 시각 epoch 밀리초, 없으면 None)
         }
         실패 시 None
     """
@@ -178,416 +546,1538 @@ def get_latest_daily_candle(symbol):
         'count': 1,
         'market': f'KRW-{symbol}'
     }
-    headers = {"accept": "application/json"}
 
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = request_bithumb(url, params)
 
         # 빗썸 API는 배열로 응답
         if not isinstance(data, list) or len(data) == 0:
             logger.error(f"[{symbol}] 예상하지 못한 API 응답 형식: {type(data)}")
             return None
 
-        candle = data[0]
-
-        return {
-            'opening_price': float(candle['opening_price']),
-            'trade_price': float(candle['trade_price']),
-            'high_price': float(candle['high_price']),
-            'low_price': float(candle['low_price']),
-            'candle_acc_trade_volume': float(candle['candle_acc_trade_volume']),
-            'candle_date_time_kst': candle['candle_date_time_kst']
-        }
+        return parse_daily_candle(data[0])
     except Exception as e:
         logger.error(f"[{symbol}] 일간 캔들 조회 실패: {str(e)}")
         return None
 
 
-def initialize_symbol_table(symbol, db):
+def get_latest_daily_candles(symbols):
     """
-    종목 테이블 초기화
+    여러 종목의 오늘 일간 캔들 데이터 일괄 조회 (현재가 API 사용)
 
-    테이블이 없으면:
-    1. 테이블 생성
-    2. N일치 일봉 캔들 데이터 조회
-    3. DB에 일괄 삽입
+    /v1/ticker?markets=KRW-A,KRW-B,... 엔드포인트로 TICKER_CHUNK_SIZE개씩
+    묶어서 호출하므로 N개 종목도 몇 번의 요청으로 조회 가능
 
     Args:
-        symbol: 'BTC', 'XRP', 'ETH'
-        db: DatabaseUtil 인스턴스
+        symbols: ['BTC', 'XRP', 'ETH', ...]
+
+    Returns:
+        dict: {symbol: 캔들 데이터} (get_latest_daily_candle과 동일한 형식)
+            조회에 실패한 묶음의 종목은 결과에서 빠짐
     """
-    if not db.table_exists(symbol):
-        logger.info(f"[{symbol}] 테이블이 존재하지 않습니다. 초기화를 시작합니다.")
+    url = "https://api.bithumb.com/v1/ticker"
 
-        # 1. 테이블 생성
-        db.create_table(symbol)
-        logger.info(f"[{symbol}] 테이블 생성 완료: bp_price_{symbol.lower()}")
+    results = {}
 
-        # 2. 1년치(365일) 캔들 데이터 조회
-        candles = get_daily_candles(symbol, count=365)
+    for i in range(0, len(symbols), TICKER_CHUNK_SIZE):
+        chunk = symbols[i:i + TICKER_CHUNK_SIZE]
+        params = {
+            'markets': ','.join(f'KRW-{symbol}' for symbol in chunk)
+        }
+
+        try:
+            data = request_bithumb(url, params)
+
+            if not isinstance(data, list):
+                logger.error(f"현재가 일괄 조회 - 예상하지 못한 API 응답 형식: {type(data)}")
+                continue
+
+            for ticker in data:
+                symbol, candle = parse_ticker(ticker)
+                results[symbol] = candle
+        except Exception as e:
+            logger.error(f"현재가 일괄 조회 실패 ({', '.join(chunk)}): {str(e)}")
+
+    logger.info(f"현재가 일괄 조회 완료: {len(results)}/{len(symbols)}개 종목")
+    return results
 
-        if candles:
-            # 3. DB에 일괄 삽입 (오래된 순서대로)
-            candles.reverse()
-            db.bulk_insert_candles(symbol, candles)
-            logger.info(f"[{symbol}] 초기 데이터 {len(candles)}건 삽입 완료")
-        else:
-            logger.error(f"[{symbol}] 초기 데이터 로딩 실패")
-    else:
-        logger.info(f"[{symbol}] 테이블 존재 확인 완료")
 
-def process_symbol(symbol, telegram, db):
+def initialize_symbol_table(symbol, db):
     """
-    단일 종목 처리 (UPSERT 방식)
+    종목 데이터 초기화 여부 확인 (공용 bp_candles 테이블에 레코드가 없으면 신규 종목)
+
+    이력 데이터는 start_backfill이 sync_symbol_history로 채움
+
+    Args:
+        symbol: 'BTC', 'XRP', 'ETH'
+        db: DatabaseUtil 인스턴스
 
-    1. 일간 캔들 API 호출 (count=1) → 최신 캔들 데이터
-    2. API 응답에서 날짜 추출하여 DB에서 해당 날짜 레코드 조회
-    3. 레코드 없으면: INSERT (새로운 날짜)
-    4. 레코드 있으면:
-       - UPDATE 전 고가/저가 비교
-       - 갱신 시 알림 전송
-       - UPDATE 실행
+    Returns:
+        bool: 신규 종목이면 True (이력 백필 전까지 모니터링 보류 대상)
     """
-    logger.info(f"[{symbol}] 처리 시작")
+    if not db.symbol_exists(symbol):
+        logger.info(f"[{symbol}] 저장된 데이터가 없습니다. 초기화를 시작합니다.")
+        return True
 
-    # 1. 일간 캔들 API 호출
-    candle = get_latest_daily_candle(symbol)
-    if candle is None:
-        logger.warning(f"[{symbol}] API 호출 실패 - 건너뜀")
-        return
+    logger.info(f"[{symbol}] 데이터 존재 확인 완료")
+    return False
 
-    current_price = candle['trade_price']
-    logger.info(f"[{symbol}] 현재가: {current_price:,.0f}원")
 
-    # 2. API 응답에서 날짜 추출 (일관성 유지)
-    candle_date = candle['candle_date_time_kst'][:10]
-    existing_record = db.get_record_by_date(symbol, candle_date)
+class BackfillProgress:
+    """이력 백필 진행 상황 집계 및 로그 (완료 종목 수, 초당 캔들 수)"""
 
-    # 3. INSERT or UPDATE
-    if existing_record is None:
-        # INSERT: 해당 날짜 첫 실행
-        db.insert_candle(symbol, candle)
-        logger.info(f"[{symbol}] 신규 레코드 삽입 (날짜: {candle_date})")
-    else:
-        # UPDATE: 고가/저가 갱신 체크 후 업데이트
-        is_new_high = current_price > existing_record['high_price']
-        is_new_low = current_price < existing_record['low_price']
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.candles = 0
+        self.started_at = time.monotonic()
+        self.lock = threading.Lock()
 
-        if is_new_high:
-            logger.info(f"[{symbol}] 당일 고가 갱신: {existing_record['high_price']:,.0f} -> {current_price:,.0f}")
-            send_alert(symbol, 'HIGH', current_price, db, telegram)
+    def update(self, symbol, inserted):
+        with self.lock:
+            self.done += 1
+            self.candles += inserted
 
-        if is_new_low:
-            logger.info(f"[{symbol}] 당일 저가 갱신: {existing_record['low_price']:,.0f} -> {current_price:,.0f}")
-            send_alert(symbol, 'LOW', current_price, db, telegram)
+            if self.candles == 0:
+                return
 
-        # 레코드 업데이트
-        db.update_candle(symbol, candle, candle_date)
-        logger.info(f"[{symbol}] 레코드 업데이트 (종가: {current_price:,.0f}원, 날짜: {candle_date})")
+            elapsed = max(time.monotonic() - self.started_at, 1e-6)
+            logger.info(
+                f"백필 진행: {self.done}/{self.total}개 종목 완료 ([{symbol}] {inserted}건), "
+                f"누적 {self.candles}건 ({self.candles / elapsed:,.1f}건/초)"
+            )
 
-def create_chart(symbol, candles):
+
+def start_backfill(monitored_symbols, db, backfill_db, executor):
     """
-    차트 이미지 생성 (yy-mm-dd 포맷, 한국어 지원, 상단 밀착 타이틀, 기간별 이동평균선 추가)
+    전 종목 테이블 초기화 후 이력 동기화를 워커 풀에서 병렬 실행
+
+    빗썸 호출은 전역 rate limiter를 거치므로 워커 수와 무관하게 허용 속도 이내로 실행되며,
+    기존 테이블의 누락 구간 동기화는 모니터링과 동시에 백그라운드로 진행
+    - 백필 쓰기는 별도 연결(backfill_db)로 즉시 커밋하여 모니터링 사이클 트랜잭션과 분리
+      (사이클이 롤백되어도 백필 데이터와 동기화 상태는 유지)
+    - 삽입이 끝나면 모니터링 연결(db)의 해당 종목 요약/캐시 폐기
+
     Args:
-        symbol: 종목코드
-        candles: 캔들 데이터 리스트 (최소 120개 이상 권장 for MA)
+        monitored_symbols: 모니터링 대상 종목 리스트
+        db: 모니터링용 DatabaseUtil 인스턴스
+        backfill_db: 백필 전용 DatabaseUtil 인스턴스 (같은 DB 파일의 별도 연결)
+        executor: 백필용 ThreadPoolExecutor
+
+    Returns:
+        dict: {symbol: Future} - 테이블을 새로 만든 종목의 백필 작업
+            (완료 전까지 모니터링 대상에서 제외)
     """
-    try:
-        # 이전 차트 파일 정리 (해당 symbol의 png 파일 삭제)
-        data_dir = f"{PROJECT_ROOT}/data"
-        for old_chart in glob.glob(f"{data_dir}/chart_{symbol}_*.png"):
-            try:
-                os.remove(old_chart)
-                logger.info(f"[{symbol}] 이전 차트 파일 삭제: {os.path.basename(old_chart)}")
-            except Exception as e:
-                logger.warning(f"[{symbol}] 이전 차트 파일 삭제 실패: {os.path.basename(old_chart)}, {str(e)}")
-        
-        # 데이터프레임 변환
-        df = pd.DataFrame(candles)
-        
-        # 컬럼명 매핑 (빗썸 -> mplfinance)
-        mapping = {
-            'candle_date_time_kst': 'Date',
-            'opening_price': 'Open',
-            'high_price': 'High',
-            'low_price': 'Low',
-            'trade_price': 'Close',
-            'candle_acc_trade_volume': 'Volume'
-        }
-        df = df.rename(columns={k: v for k, v in mapping.items() if k in df.columns})
-        
-        # 인덱스 설정
-        df['Date'] = pd.to_datetime(df['Date'])
-        df.set_index('Date', inplace=True)
-        df.sort_index(inplace=True)
+    progress = BackfillProgress(len(monitored_symbols))
 
-        # 이동평균선 계산 (5, 20, 60, 120)
-        ma_colors = {
-            '5일': '#2ca02c',   # Green
-            '20일': '#d62728',  # Red
-            '60일': '#ff7f0e',  # Orange
-            '120일': '#9467bd'  # Purple
-        }
-        
-        df['MA5'] = df['Close'].rolling(window=5).mean()
-        df['MA20'] = df['Close'].rolling(window=20).mean()
-        df['MA60'] = df['Close'].rolling(window=60).mean()
-        df['MA120'] = df['Close'].rolling(window=120).mean()
+    def run_backfill(symbol):
+        try:
+            inserted = sync_symbol_history(symbol, backfill_db)
+            if inserted:
+                db.invalidate_symbol(symbol)
+        except Exception as e:
+            logger.error(f"[{symbol}] 이력 백필 오류: {str(e)}", exc_info=True)
+            inserted = 0
+        progress.update(symbol, inserted)
+        return inserted
+
+    backfills = {}
+    for symbol in monitored_symbols:
+        is_new = initialize_symbol_table(symbol, db)
+        future = executor.submit(run_backfill, symbol)
+        if is_new:
+            backfills[symbol] = future
 
-        # 최근 120일 데이터만 슬라이싱 (계산 후 자르기)
-        df = df.iloc[-120:]
+    return backfills
 
-        # 폰트 및 스타일 설정 (Noto Sans KR 사용)
-        FONT_PATH = f"{PROJECT_ROOT}/fonts/NotoSansKR-Regular.ttf"
-        
-        # 폰트를 matplotlib 폰트 매니저에 등록
-        fm.fontManager.addfont(FONT_PATH)
-        font_prop = fm.FontProperties(fname=FONT_PATH)
-        font_name = font_prop.get_name()
-        
-        plt.rcParams['font.family'] = font_name
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 차트 스타일 설정
-        mc = mpf.make_marketcolors(up='red', down='blue', inherit=True)
-        s = mpf.make_mpf_style(
-            marketcolors=mc, 
-            gridstyle='--', 
-            y_on_right=True,
-            rc={'font.family': font_name, 'axes.unicode_minus': False}
-        )
 
-        data_dir = f"{PROJECT_ROOT}/data"
-        save_path = f"{data_dir}/chart_{symbol}_{datetime.now().strftime('%y%m%d_%H%M%S')}.png"
+def refresh_backfill(backfill_date, monitored_symbols, db, backfill_db, executor, backfills):
+    """
+    KST 날짜가 바뀌었으면 이력 동기화 재실행 (상주 모드의 하루 1회 증분 백필)
 
-        # 추가 플롯 (이동평균선)
-        ap = [
-            mpf.make_addplot(df['MA5'], color=ma_colors['5일'], width=1.0),
-            mpf.make_addplot(df['MA20'], color=ma_colors['20일'], width=1.0),
-            mpf.make_addplot(df['MA60'], color=ma_colors['60일'], width=1.0),
-            mpf.make_addplot(df['MA120'], color=ma_colors['120일'], width=1.0)
-        ]
+    sync_symbol_history는 당일 동기화 기록이 있으면 건너뛰므로 날짜가 바뀐 뒤 한 번만 실행하면 됨
 
-        # 차트 그리기
-        fig, axes = mpf.plot(
-            df,
-            type='candle',
-            volume=True,
-            style=s,
-            addplot=ap,
-            ylabel='', # Y축 라벨 제거
-            ylabel_lower='', # 거래량 라벨 제거
-            datetime_format='%y-%m-%d',
-            returnfig=True,
-            figratio=(10, 7)
-        )
-        
-        plt.rcParams['axes.formatter.useoffset'] = False
-        
-        axes[0].set_title(f"{symbol}/KRW 차트", fontsize=10, fontweight='bold', pad=8)
-        
-        def conditional_formatter(x, p):
-            if abs(x) >= 10000:
-                return f'{int(x/1000):,}K'
-            return f'{int(x):,}'
-
-        for ax in fig.get_axes():
-            # 10^6 제거
-            ax.yaxis.get_offset_text().set_visible(False)
-            ax.yaxis.get_offset_text().set_text("")
-            ax.xaxis.get_offset_text().set_visible(False)
-            ax.xaxis.get_offset_text().set_text("")
-            ax.yaxis.set_major_formatter(mticker.FuncFormatter(conditional_formatter))
-
-        from matplotlib.text import Text
-        for obj in fig.findobj(Text):
-            text = obj.get_text()
-            if text and '10' in text and ('^' in text or '×' in text or 'e' in text):
-                obj.set_visible(False)
-
-        # X축 레이아웃 설정
-        if len(axes) > 0:
-            for ax in fig.get_axes():
-                ax.set_xlim(-0.5, len(df)-0.5)
-                
-                total_days = len(df)
-                num_ticks = 5
-                tick_indices = [int(i) for i in np.linspace(0, total_days - 1, num_ticks)]
-                
-                ax.set_xticks(tick_indices)
-                ax.set_xticklabels([df.index[i].strftime('%y-%m-%d') for i in tick_indices])
-                
-                for label in ax.get_xticklabels():
-                    label.set_fontsize(7.5)
-                    label.set_rotation(0)
-                    label.set_horizontalalignment('center')
-                ax.tick_params(axis='x', pad=5)
-
-        # 현재 일시 표시 (우측 상단)
-        current_time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        axes[0].text(0.99, 1.01, current_time_str, transform=axes[0].transAxes, 
-                     ha='right', va='bottom', fontsize=8)
-
-        # 하단 범례 추가 (fig.legend 사용)
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], color=color, lw=2, label=label) 
-            for label, color in ma_colors.items()
-        ]
-        
-        # 범례를 하단 중앙에 배치
-        fig.legend(handles=legend_elements, loc='lower center', 
-                   bbox_to_anchor=(0.55, 0.08), ncol=4, frameon=False, prop={'size': 9, 'weight': 'bold'})
+    Args:
+        backfill_date: 마지막으로 백필을 시작한 날짜 (date)
+        monitored_symbols: 모니터링 대상 종목 리스트
+        db: 모니터링용 DatabaseUtil 인스턴스
+        backfill_db: 백필 전용 DatabaseUtil 인스턴스
+        executor: 백필용 ThreadPoolExecutor
+        backfills: start_backfill이 반환한 백필 작업 (신규 종목 작업으로 갱신)
+
+    Returns:
+        date: 마지막으로 백필을 시작한 날짜
+    """
+    today = datetime.now(KST).date()
+    if today == backfill_date:
+        return backfill_date
 
-        # 여백 조정: 하단 여백을 충분히 주어 범례 공간 확보
-        fig.subplots_adjust(top=0.90, bottom=0.15, left=0.08, right=0.92)
+    logger.info(f"날짜 변경({today}) - 이력 증분 백필 시작")
+    backfills.update(start_backfill(monitored_symbols, db, backfill_db, executor))
+    return today
 
-        # 이미지 저장
-        fig.savefig(save_path, dpi=100, bbox_inches='tight', pad_inches=0.05)
-        plt.close(fig)
 
-        logger.info(f"[{symbol}] 차트 생성 완료: {os.path.basename(save_path)}")
-        return save_path
-    except Exception as e:
-        logger.error(f"[{symbol}] 차트 생성 실패: {str(e)}")
-        raise
+def get_ready_symbols(monitored_symbols, backfills):
+    """백필이 끝나 모니터링 가능한 종목 목록 (설정 순서 유지)"""
+    return [
+        symbol for symbol in monitored_symbols
+        if symbol not in backfills or backfills[symbol].done()
+    ]
 
-def format_percent_diff(current_price, period_price):
+
+def find_missing_ranges(start_date, end_date, stored_dates):
     """
-    현재가 대비 기간별 가격의 퍼센트 차이 계산
-    
+    기간 내 DB에 없는 날짜를 연속 구간으로 묶어서 반환
+
     Args:
-        current_price: 현재가
-        period_price: 기간별 고가/저가 (None 가능)
-    
-    Returns:
-        str: " (+2.50%)" 또는 " (-3.75%)" 또는 ""
-    """
-    if period_price is None or period_price == 0:
-        return ""
-    
-    diff_amount = current_price - period_price
-    
-    # 차이가 0이면 표시 안 함
-    if diff_amount == 0:
-        return ""
-    
-    percent = (diff_amount / period_price) * 100
-    
-    if diff_amount > 0:
-        return f" (+{percent:.2f}%)"
-    else:
-        return f" ({percent:.2f}%)"
+        start_date: 시작일 (date)
+        end_date: 종료일 (date, 포함)
+        stored_dates: DB에 저장된 날짜 문자열 집합 {'YYYY-MM-DD', ...}
 
-def send_alert(symbol, alert_type, current_price, db, telegram):
-    """
-    텔레그램 알림 전송 (텍스트 + 차트)
+    Returns:
+        list: [(구간 시작일, 구간 종료일), ...] (오래된 구간부터)
     """
+    ranges = []
+    range_start = None
+    day = start_date
 
-    if alert_type == 'HIGH':
-        alert_text = "🟥 당일 고가 갱신"
-        price_5d = db.get_period_high(symbol, 5)
-        price_20d = db.get_period_high(symbol, 20)
-        price_60d = db.get_period_high(symbol, 60)
-        price_120d = db.get_period_high(symbol, 120)
-        period_label = "최고가"
-    else:
-        alert_text = "🟦 당일 저가 갱신"
-        price_5d = db.get_period_low(symbol, 5)
-        price_20d = db.get_period_low(symbol, 20)
-        price_60d = db.get_period_low(symbol, 60)
-        price_120d = db.get_period_low(symbol, 120)
-        period_label = "최저가"
+    while day <= end_date:
+        if day.isoformat() in stored_dates:
+            if range_start is not None:
+                ranges.append((range_start, day - timedelta(days=1)))
+                range_start = None
+        elif range_start is None:
+            range_start = day
+        day += timedelta(days=1)
 
-    # 기간별 가격 포맷팅
-    price_5d_str = f"{price_5d:,.0f}" if price_5d is not None else "N/A"
-    price_20d_str = f"{price_20d:,.0f}" if price_20d is not None else "N/A"
-    price_60d_str = f"{price_60d:,.0f}" if price_60d is not None else "N/A"
-    price_120d_str = f"{price_120d:,.0f}" if price_120d is not None else "N/A"
+    if range_start is not None:
+        ranges.append((range_start, end_date))
 
-    # 퍼센트 차이 계산
-    diff_5d = format_percent_diff(current_price, price_5d)
-    diff_20d = format_percent_diff(current_price, price_20d)
-    diff_60d = format_percent_diff(current_price, price_60d)
-    diff_120d = format_percent_diff(current_price, price_120d)
+    return ranges
 
-    # 메시지 작성
-    message = f"""
-<b>{alert_text}</b>
-<b>종목코드: {symbol}</b>
-현재가: {current_price:,.0f}원
-5일{period_label}: {price_5d_str}원{diff_5d}
-20일{period_label}: {price_20d_str}원{diff_20d}
-60일{period_label}: {price_60d_str}원{diff_60d}
-120일{period_label}: {price_120d_str}원{diff_120d}
-
-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-""".strip()
 
-    try:
-        # 차트 생성 (DB에서 최근 365일 데이터 조회 - 120일 이동평균선 계산용)
-        candles = db.get_period_candles(symbol, days=365)
-        chart_path = None
-        if candles:
-            chart_path = create_chart(symbol, candles)
+def sync_symbol_history(symbol, db, history_days=None):
+    """
+    일봉 이력 증분 동기화 (하루 1회)
 
-            if chart_path:
-                telegram.send_photo(chart_path, caption=message)
-        else:
-            telegram.send_message(message)
-            
-        logger.info(f"[{symbol}] 알림 전송 완료")
-    except Exception as e:
-        error_msg = f"⚠️ [{symbol}] 알림 전송 중 오류 발생: {str(e)}"
-        logger.error(error_msg)
-        try:
-            telegram.send_test_message(error_msg)
-        except:
-            pass
+    최근 history_days일 중 DB에 없는 날짜(최신 구간, 중간 구멍, 과거 구간)를 찾아
+    get_daily_candles의 to 페이지네이션으로 해당 구간만 조회 후 삽입
+    - 오늘 캔들은 process_symbol이 저장하므로 제외
+    - 상장일 이전처럼 거래소에도 없는 과거 구간은 first_date로 기록하여 재조회하지 않음
 
+    Args:
+        symbol: 'BTC', 'XRP', 'ETH'
+        db: DatabaseUtil 인스턴스
+        history_days: 유지할 이력 일수 (기본값: HISTORY_DAYS)
 
-def main():
-    """메인 실행 함수"""
+    Returns:
+        int: 삽입한 캔들 개수
+    """
+    history_days = history_days or HISTORY_DAYS
+    today = datetime.now(KST).date()
+
+    # 오늘 이미 같은 깊이로 동기화했으면 건너뜀
+    state = db.get_sync_state(symbol)
+    if state and state['synced_date'] == today.isoformat() and state['history_days'] >= history_days:
+        return 0
+
+    first_date = state['first_date'] if state else None
+    start_date = today - timedelta(days=history_days - 1)
+    if first_date and first_date > start_date.isoformat():
+        start_date = datetime.strptime(first_date, '%Y-%m-%d').date()
+    end_date = today - timedelta(days=1)
+
+    stored_dates = set(db.get_stored_dates(symbol, start_date.isoformat()))
+    missing_ranges = find_missing_ranges(start_date, end_date, stored_dates)
+
+    if missing_ranges:
+        missing_days = sum((range_end - range_start).days + 1 for range_start, range_end in missing_ranges)
+        logger.info(f"[{symbol}] 누락 구간 {len(missing_ranges)}개 (총 {missing_days}일) 백필 시작")
+
+    inserted = 0
+    completed = True
+
+    for range_start, range_end in missing_ranges:
+        # to는 구간 다음날 0시 (해당 시각 이전 캔들부터 조회), 시간대 차이를 고려해 1개 여유 조회
+        count = (range_end - range_start).days + 2
+        to = f"{(range_end + timedelta(days=1)).isoformat()} 00:00:00"
+        # 중간 페이지 실패로 잘린 결과를 거래소 데이터 끝으로 오인하지 않도록 부분 데이터는 받지 않음
+        candles = get_daily_candles(symbol, count=count, to=to, allow_partial=False)
+
+        if candles is None:
+            logger.error(f"[{symbol}] 백필 실패: {range_start} ~ {range_end}")
+            completed = False
+            continue
+
+        # 구간 내 누락 날짜만 삽입 (오래된 순서대로)
+        new_candles = [
+            candle for candle in reversed(candles)
+            if range_start.isoformat() <= candle['candle_date_time_kst'][:10] <= range_end.isoformat()
+            and candle['candle_date_time_kst'][:10] not in stored_dates
+        ]
+        if new_candles:
+            inserted += db.bulk_insert_candles(symbol, new_candles)
 
-    # 1. 환경변수 검증
-    validate_env()
+        # 가장 오래된 구간인데 거래소가 요청보다 적게 반환(마지막 페이지가 짧거나 비어 있음)하여
+        # 시작일까지 거슬러 올라가지 못했으면 거래소 보유 데이터의 시작일로 기록
+        exhausted = len(candles) < count
+        reached_start = any(candle['candle_date_time_kst'][:10] <= range_start.isoformat() for candle in candles)
+        if range_start == start_date and exhausted and not reached_start:
+            first_date = new_candles[0]['candle_date_time_kst'][:10] if new_candles else (range_end + timedelta(days=1)).isoformat()
+            logger.info(f"[{symbol}] 거래소 데이터 시작일: {first_date}")
 
-    # 2. 초기화
-    telegram = TelegramUtil()
-    db = DatabaseUtil(DB_PATH)
+    if completed:
+        db.set_sync_state(symbol, first_date, history_days, today.isoformat())
 
-    # 환경변수에서 모니터링 코인 가져오기
-    monitored_symbols = os.getenv('MONITORED_SYMBOLS').split(',')
-    monitored_symbols = [s.strip().upper() for s in monitored_symbols]
+    if missing_ranges:
+        logger.info(f"[{symbol}] 백필 완료: {inserted}건 삽입")
 
-    logger.info("=== 빗썸 가격 모니터 시작 ===")
-    logger.info(f"모니터링 대상: {', '.join(monitored_symbols)}")
+    return inserted
 
-    # 3. DB 연결
-    db.connect()
 
-    # 4. 각 종목 테이블 초기화 (없으면 생성 + N일 데이터 로딩)
-    for symbol in monitored_symbols:
-        initialize_symbol_table(symbol, db)
+def process_symbol(symbol, db, candle=None):
+    """
+    단일 종목 처리 (UPSERT 방식)
 
-    # 5. 각 코인 처리
-    for symbol in monitored_symbols:
-        process_symbol(symbol, telegram, db)
+    1. 최신 캔들 데이터 확보
+       - candle 인자가 있으면 그대로 사용 (일괄 조회 결과)
+       - 없으면 일간 캔들 API 호출 (count=1)
+    2. INSERT ... ON CONFLICT DO UPDATE ... RETURNING으로 저장하면서 직전 고가/저가 확보
+    3. 직전 고가/저가와 현재가 비교 → 갱신 시 보낼 알림 반환
+
+    알림은 보내지 않고 반환만 함 (호출 측이 저장을 커밋한 뒤 send_alerts로 전송하여
+    차트 렌더링/업로드 동안 쓰기 트랜잭션을 잡고 있지 않고, 롤백된 저장의 알림이 나가지 않게 함)
+
+    Returns:
+        list: [(symbol, 알림 유형, 캔들 데이터, 직전 가격), ...]
+    """
+    logger.info(f"[{symbol}] 처리 시작")
+
+    # 1. 일간 캔들 API 호출 (일괄 조회 결과가 없을 때만)
+    if candle is None:
+        candle = get_latest_daily_candle(symbol)
+    if candle is None:
+        logger.warning(f"[{symbol}] API 호출 실패 - 건너뜀")
+        return []
+
+    # 2~3. UPSERT → 고가/저가 갱신 판단
+    previous_prices, alert_types = save_candle(symbol, candle, db)
+
+    return [(symbol, alert_type, candle, previous_prices[alert_type]) for alert_type in alert_types]
+
+
+def save_candle(symbol, candle, db):
+    """
+    최신 캔들 저장 후 당일 고가/저가 갱신 여부 판단
+    (동기/비동기 처리 경로 공용)
+
+    UPSERT가 돌려준 직전 고가/저가와 현재가를 비교하므로 별도 조회가 필요 없음
+    현재가는 체결 시각과 함께 체결가 기록(bp_ticks)에도 추가
+
+    Args:
+        symbol: 'BTC', 'XRP', 'ETH'
+        candle: 최신 캔들 데이터
+        db: DatabaseUtil 인스턴스
+
+    Returns:
+        tuple: ({'HIGH': 직전 고가, 'LOW': 직전 저가}, 알림 유형 리스트 ['HIGH', 'LOW'])
+    """
+    current_price = candle['trade_price']
+    candle_date = candle['candle_date_time_kst'][:10]
+    logger.info(f"[{symbol}] 현재가: {current_price:,.0f}원")
+
+    prev_high, prev_low = db.upsert_candle(symbol, candle)
+    db.insert_tick(symbol, candle.get('trade_timestamp') or int(time.time() * 1000), current_price)
+    previous_prices = {'HIGH': prev_high, 'LOW': prev_low}
+
+    alert_types = []
+    if prev_high is None:
+        # 해당 날짜 첫 실행
+        logger.info(f"[{symbol}] 신규 레코드 삽입 (날짜: {candle_date})")
+        return previous_prices, alert_types
+
+    logger.info(f"[{symbol}] 레코드 업데이트 (종가: {current_price:,.0f}원, 날짜: {candle_date})")
+
+    # 고가/저가 갱신 체크 (UPDATE 전 값과 비교)
+    if current_price > prev_high:
+        logger.info(f"[{symbol}] 당일 고가 갱신: {prev_high:,.0f} -> {current_price:,.0f}")
+        alert_types.append('HIGH')
+
+    if current_price < prev_low:
+        logger.info(f"[{symbol}] 당일 저가 갱신: {prev_low:,.0f} -> {current_price:,.0f}")
+        alert_types.append('LOW')
+
+    return previous_prices, alert_types
+
+def save_chart_file(symbol, image):
+    """
+    차트 이미지를 data/ 디렉토리에 저장 (CHART_SAVE_TO_DISK 사용 시)
+
+    해당 symbol의 이전 차트 파일은 삭제하고 최신 차트 1개만 유지
+
+    Args:
+        symbol: 종목코드
+        image: PNG 이미지 bytes
+
+    Returns:
+        str: 저장 경로
+    """
+    for old_chart in glob.glob(f"{DATA_DIR}/chart_{symbol}_*.png"):
+        try:
+            os.remove(old_chart)
+            logger.info(f"[{symbol}] 이전 차트 파일 삭제: {os.path.basename(old_chart)}")
+        except Exception as e:
+            logger.warning(f"[{symbol}] 이전 차트 파일 삭제 실패: {os.path.basename(old_chart)}, {str(e)}")
+
+    save_path = f"{DATA_DIR}/chart_{symbol}_{datetime.now().strftime('%y%m%d_%H%M%S')}.png"
+    with open(save_path, 'wb') as chart_file:
+        chart_file.write(image)
+
+    logger.info(f"[{symbol}] 차트 파일 저장: {os.path.basename(save_path)}")
+    return save_path
+
+
+def find_volume_axis(axes):
+    """
+    mplfinance가 반환한 축 목록에서 거래량 패널 축 찾기
+
+    축 목록의 순서/개수(보조 축 포함 여부)는 mplfinance 버전에 따라 다를 수 있으므로
+    위치 대신 거래량 막대(bar 컨테이너)가 그려진 축을 찾고, 없으면 가장 아래 패널 축 사용
+    """
+    for ax in axes[1:]:
+        if ax.containers:
+            return ax
+    return min(axes, key=lambda ax: ax.get_position().y0)
+
+
+def plot_chart(symbol, df, chart_context, incremental=False):
+    """
+    mplfinance 차트 figure 생성 (yy-mm-dd 포맷, 한국어 지원, 상단 밀착 타이틀, 기간별 이동평균선 추가)
+
+    (render_lock 안에서 호출)
+
+    Args:
+        symbol: 종목코드
+        df: 이동평균선 컬럼(MA5/MA20/MA60/MA120)이 추가된 표시 구간 DataFrame
+        chart_context: ChartContext
+        incremental: True면 당일 행을 뺀 배경만 그림 (당일 자리는 x축 범위로 비워 두고
+            당일 캔들은 LiveChart 아티스트로 따로 그림, 당일 행뿐이면 그대로 그림)
+
+    Returns:
+        tuple: (fig, 가격 축, 거래량 축)
+    """
+    plot_df = df.iloc[:-1] if incremental and len(df) > 1 else df
+
+    # 증분 렌더링은 당일 아티스트와 모양/축을 맞추도록 캔들 폭과 이동평균선 축을 고정
+    addplot_options = {'secondary_y': False} if incremental else {}
+    plot_options = {}
+    if incremental:
+        plot_options['update_width_config'] = {
+            'candle_width': CHART_OPTIONS['candle_width'],
+            'candle_linewidth': CHART_OPTIONS['candle_linewidth'],
+            'volume_width': CHART_OPTIONS['volume_width']
+        }
+
+    # 추가 플롯 (이동평균선)
+    ap = [
+        mpf.make_addplot(plot_df[f'MA{days}'], color=color, width=1.0, **addplot_options)
+        for days, color in CHART_MA_COLORS.items()
+    ]
+
+    # 차트 그리기
+    fig, axes = mpf.plot(
+        plot_df,
+        type='candle',
+        volume=True,
+        style=chart_context.style,
+        addplot=ap,
+        ylabel='', # Y축 라벨 제거
+        ylabel_lower='', # 거래량 라벨 제거
+        datetime_format='%y-%m-%d',
+        returnfig=True,
+        figratio=CHART_OPTIONS['figratio'],
+        **plot_options
+    )
+    price_ax, volume_ax = axes[0], find_volume_axis(axes)
+
+    price_ax.set_title(f"{symbol}/KRW 차트", fontsize=10, fontweight='bold', pad=8)
+
+    def conditional_formatter(x, p):
+        if abs(x) >= 10000:
+            return f'{int(x/1000):,}K'
+        return f'{int(x):,}'
+
+    for ax in fig.get_axes():
+        # 10^6 제거
+        ax.yaxis.get_offset_text().set_visible(False)
+        ax.yaxis.get_offset_text().set_text("")
+        ax.xaxis.get_offset_text().set_visible(False)
+        ax.xaxis.get_offset_text().set_text("")
+        ax.yaxis.set_major_formatter(mticker.FuncFormatter(conditional_formatter))
+
+    for obj in fig.findobj(Text):
+        text = obj.get_text()
+        if text and '10' in text and ('^' in text or '×' in text or 'e' in text):
+            obj.set_visible(False)
+
+    # X축 레이아웃 설정
+    for ax in fig.get_axes():
+        ax.set_xlim(-0.5, len(df)-0.5)
+
+        total_days = len(df)
+        num_ticks = 5
+        tick_indices = [int(i) for i in np.linspace(0, total_days - 1, num_ticks)]
+
+        ax.set_xticks(tick_indices)
+        ax.set_xticklabels([df.index[i].strftime('%y-%m-%d') for i in tick_indices])
+
+        for label in ax.get_xticklabels():
+            label.set_fontsize(7.5)
+            label.set_rotation(0)
+            label.set_horizontalalignment('center')
+        ax.tick_params(axis='x', pad=5)
+
+    # 하단 범례 추가 (fig.legend 사용)
+    legend_elements = [
+        Line2D([0], [0], color=color, lw=2, label=f'{days}일')
+        for days, color in CHART_MA_COLORS.items()
+    ]
+
+    # 범례를 하단 중앙에 배치
+    fig.legend(handles=legend_elements, loc='lower center',
+               bbox_to_anchor=(0.55, 0.08), ncol=4, frameon=False, prop={'size': 9, 'weight': 'bold'})
+
+    # 여백 조정: 하단 여백을 충분히 주어 범례 공간 확보
+    fig.subplots_adjust(top=0.90, bottom=0.15, left=0.08, right=0.92)
+
+    return fig, price_ax, volume_ax
+
+
+def build_live_chart(symbol, df, key, chart_context):
+    """
+    증분 렌더링용 차트 배경 생성
+
+    당일 캔들/거래량/이동평균선 끝점/생성 시각을 제외한 나머지를 한 번만 그리고,
+    당일 값은 animated 아티스트로 만들어 렌더링 때마다 다시 그림
+    (render_lock 안에서 호출)
+
+    Args:
+        symbol: 종목코드
+        df: 이동평균선 컬럼(MA5/MA20/MA60/MA120)이 추가된 표시 구간 DataFrame
+        key: 배경 식별 키
+        chart_context: ChartContext
+
+    Returns:
+        LiveChart: 당일 값까지 반영된 차트
+    """
+    last = len(df) - 1
+    today = df.iloc[-1]
+
+    fig, price_ax, volume_ax = plot_chart(symbol, df, chart_context, incremental=True)
+
+    # 배경의 축 범위는 당일 제외 데이터 기준이므로 당일 값이 들어가도록 확장
+    price_low, price_high = price_ax.get_ylim()
+    margin = (price_high - price_low) * 0.05
+    price_ax.set_ylim(min(price_low, today['Low'] - margin), max(price_high, today['High'] + margin))
+    volume_ax.set_ylim(top=max(volume_ax.get_ylim()[1], today['Volume'] * 1.1))
+
+    # 당일 캔들/거래량/이동평균선 끝점/생성 시각 (렌더링 때마다 다시 그림)
+    candle_width = CHART_OPTIONS['candle_width']
+    volume_width = CHART_OPTIONS['volume_width']
+    artists = {
+        'wick': price_ax.add_line(Line2D([last, last], [0, 0], linewidth=CHART_OPTIONS['candle_linewidth'], animated=True)),
+        'body': price_ax.add_patch(Rectangle((last - candle_width / 2, 0), candle_width, 0,
+                                             linewidth=CHART_OPTIONS['candle_linewidth'], animated=True)),
+        'volume': volume_ax.add_patch(Rectangle((last - volume_width / 2, 0), volume_width, 0, animated=True))
+    }
+    for days, color in CHART_MA_COLORS.items():
+        artists[f'MA{days}'] = price_ax.add_line(
+            Line2D([last - 1, last], [np.nan, np.nan], color=color, linewidth=1.0, animated=True)
+        )
+
+    # 현재 일시 표시 (우측 상단)
+    artists['timestamp'] = price_ax.text(0.99, 1.01, '', transform=price_ax.transAxes,
+                                         ha='right', va='bottom', fontsize=8, animated=True)
+
+    # 출력 영역(tight bbox) 계산에 당일 값과 생성 시각이 포함되도록 먼저 반영
+    update_live_artists(artists, df, chart_context.market_colors)
+    return LiveChart(key, fig, price_ax, volume_ax, artists, dpi=CHART_OPTIONS['dpi'])
+
+
+def render_full_chart(symbol, df, chart_context):
+    """
+    차트 전체를 매번 새로 그려 PNG로 렌더링 (배경 재사용 없음, render_lock 안에서 호출)
+
+    Args:
+        symbol: 종목코드
+        df: 이동평균선 컬럼이 추가된 표시 구간 DataFrame
+        chart_context: ChartContext
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    fig, price_ax, _ = plot_chart(symbol, df, chart_context)
+
+    # 현재 일시 표시 (우측 상단)
+    current_time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    price_ax.text(0.99, 1.01, current_time_str, transform=price_ax.transAxes,
+                  ha='right', va='bottom', fontsize=8)
+
+    # 이미지 렌더링 (메모리 버퍼)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=CHART_OPTIONS['dpi'], bbox_inches='tight', pad_inches=0.05)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def update_live_artists(artists, df, market_colors):
+    """
+    당일 캔들/거래량/이동평균선 끝점/생성 시각 아티스트를 df 마지막 행 값으로 갱신
+
+    Args:
+        artists: LiveChart 아티스트 {이름: 아티스트}
+        df: 이동평균선 컬럼이 추가된 표시 구간 DataFrame
+        market_colors: mplfinance marketcolors (상승/하락 색상)
+    """
+    last = len(df) - 1
+    today = df.iloc[-1]
+    previous = df.iloc[-2] if len(df) > 1 else today
+    direction = 'up' if today['Close'] >= today['Open'] else 'down'
+
+    artists['wick'].set_ydata([today['Low'], today['High']])
+    artists['wick'].set_color(market_colors['wick'][direction])
+
+    body = artists['body']
+    body.set_y(min(today['Open'], today['Close']))
+    body.set_height(abs(today['Close'] - today['Open']))
+    body.set_facecolor(market_colors['candle'][direction])
+    body.set_edgecolor(market_colors['edge'][direction])
+    body.set_alpha(market_colors.get('alpha'))
+
+    artists['volume'].set_height(today['Volume'])
+    artists['volume'].set_color(market_colors['volume'][direction])
+
+    for days in CHART_MA_COLORS:
+        artists[f'MA{days}'].set_data([last - 1, last], [previous[f'MA{days}'], today[f'MA{days}']])
+
+    artists['timestamp'].set_text(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+
+def create_chart(symbol, candles):
+    """
+    차트 이미지 생성
+
+    - 기본(CHART_BACKGROUND_CACHE_SIZE=0): 매번 차트 전체를 새로 그림 (render_full_chart)
+    - 증분 렌더링(CHART_BACKGROUND_CACHE_SIZE>0): 당일 이전 일봉/옵션/날짜가 같으면 종목별로
+      캐시한 배경(LiveChart)을 재사용하고 당일 캔들/거래량/이동평균선 끝점/생성 시각만 다시 그림
+      (배경이 없거나 입력이 바뀌었거나 당일 값이 축 범위를 벗어나면 배경부터 새로 생성)
+
+    메모리 버퍼(BytesIO)에 PNG로 렌더링하여 bytes로 반환 (텔레그램 업로드에 그대로 사용)
+    CHART_SAVE_TO_DISK가 켜져 있으면 data/ 디렉토리에도 저장
+
+    Args:
+        symbol: 종목코드
+        candles: 일봉 CandleArray (최소 120개 이상 권장 for MA)
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    try:
+        # 데이터프레임 변환 (Date 인덱스 + mplfinance 컬럼명, 복사 없음)
+        df = candles.to_dataframe()
+
+        # 이동평균선 계산 (5, 20, 60, 120)
+        for days in CHART_MA_COLORS:
+            df[f'MA{days}'] = df['Close'].rolling(window=days).mean()
+
+        # 최근 120일 데이터만 슬라이싱 (계산 후 자르기)
+        df = df.iloc[-CHART_OPTIONS['display_days']:]
+        today = df.iloc[-1]
+
+        # 폰트/스타일은 프로세스당 한 번만 준비 (이후 차트는 재사용)
+        chart_context = ChartContext(CHART_FONT_PATH)
+
+        # pyplot 전역 상태와 캐시된 figure를 쓰는 구간은 동시 렌더링 간 직렬화
+        with chart_context.render_lock:
+            if live_charts.max_entries == 0:
+                image = render_full_chart(symbol, df, chart_context)
+            else:
+                key = make_background_key(symbol, candles, CHART_OPTIONS)
+                chart = live_charts.get(symbol, key, today['Low'], today['High'], today['Volume'])
+                if chart is None:
+                    chart = build_live_chart(symbol, df, key, chart_context)
+                    live_charts.put(symbol, chart)
+                    logger.info(f"[{symbol}] 차트 배경 생성")
+                else:
+                    update_live_artists(chart.artists, df, chart_context.market_colors)
+
+                image = chart.render()
+
+        logger.info(f"[{symbol}] 차트 생성 완료: {len(image):,} bytes")
+
+        if CHART_SAVE_TO_DISK:
+            save_chart_file(symbol, image)
+
+        return image
+    except Exception as e:
+        logger.error(f"[{symbol}] 차트 생성 실패: {str(e)}")
+        raise
+
+
+def render_chart_image(symbol, candles):
+    """
+    차트 렌더링 (렌더링 프로세스 풀이 있으면 워커에서, 없으면 현재 스레드에서 create_chart 실행)
+
+    Args:
+        symbol: 종목코드
+        candles: 일봉 CandleArray
+
+    Returns:
+        bytes: PNG 이미지
+        None: 렌더링 대기열이 가득 찼거나, 워커가 시간 내 응답하지 않았거나 비정상 종료되어 생략
+            (알림은 텍스트로 전송)
+    """
+    if chart_renderer is None:
+        return create_chart(symbol, candles)
+
+    try:
+        # 워커로 넘길 때 pickle되므로 이후 캐시 버퍼 갱신과 무관한 복사본 전달
+        future = chart_renderer.submit(symbol, candles.copy())
+        if future is None:
+            logger.warning(f"[{symbol}] 차트 렌더링 대기열 초과 ({chart_renderer.max_pending}개) - 차트 생략")
+            return None
+
+        return future.result(timeout=CHART_RENDER_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        logger.error(f"[{symbol}] 차트 렌더링 시간 초과 ({CHART_RENDER_TIMEOUT}초) - 차트 생략")
+        return None
+    except BrokenProcessPool as e:
+        # 비정상 종료된 워커 풀은 다음 요청 시 ChartRenderService가 교체
+        logger.error(f"[{symbol}] 차트 렌더링 워커 비정상 종료 - 차트 생략: {str(e)}")
+        return None
+
+
+def get_chart_image(symbol, candles):
+    """
+    차트 이미지 조회 (캐시 적중 시 렌더링 생략, 미적중 시 렌더링 후 캐시에 저장)
+
+    Args:
+        symbol: 종목코드
+        candles: 일봉 CandleArray
+
+    Returns:
+        bytes: PNG 이미지
+        None: 렌더링 생략 (대기열 초과/시간 초과/워커 비정상 종료, 텍스트만 전송)
+    """
+    if chart_cache is None:
+        return render_chart_image(symbol, candles)
+
+    key = chart_cache.make_key(symbol, candles, CHART_OPTIONS)
+    image = chart_cache.get(key)
+    if image is not None:
+        logger.info(f"[{symbol}] 차트 캐시 적중 (적중률: {chart_cache.hit_rate:.1%})")
+        return image
+
+    image = render_chart_image(symbol, candles)
+    if image is not None:
+        chart_cache.put(key, image)
+    return image
+
+
+def init_chart_worker():
+    """
+    차트 렌더링 워커 프로세스 초기화 (프로세스당 1회)
+
+    폰트/스타일을 미리 로드하고, 종료 시그널은 부모 프로세스가 처리하도록 무시
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    ChartContext(CHART_FONT_PATH)
+
+
+def start_chart_renderer():
+    """상주 모드 차트 렌더링 프로세스 풀 시작 (CHART_RENDER_WORKERS가 0이면 현재 스레드에서 렌더링)"""
+    global chart_renderer
+    if CHART_RENDER_WORKERS > 0:
+        chart_renderer = ChartRenderService(create_chart, CHART_RENDER_WORKERS, CHART_RENDER_MAX_PENDING,
+                                            initializer=init_chart_worker)
+        logger.info(f"차트 렌더링 워커 {CHART_RENDER_WORKERS}개 시작 (최대 대기: {CHART_RENDER_MAX_PENDING}개)")
+
+
+def stop_chart_renderer():
+    """차트 렌더링 프로세스 풀 종료"""
+    global chart_renderer
+    if chart_renderer is not None:
+        chart_renderer.shutdown()
+        chart_renderer = None
+
+
+def format_percent_diff(current_price, period_price):
+    """
+    현재가 대비 기간별 가격의 퍼센트 차이 계산
+    
+    Args:
+        current_price: 현재가
+        period_price: 기간별 고가/저가 (None 가능)
+    
+    Returns:
+        str: " (+2.50%)" 또는 " (-3.75%)" 또는 ""
+    """
+    if period_price is None or period_price == 0:
+        return ""
+    
+    diff_amount = current_price - period_price
+    
+    # 차이가 0이면 표시 안 함
+    if diff_amount == 0:
+        return ""
+    
+    percent = (diff_amount / period_price) * 100
+    
+    if diff_amount > 0:
+        return f" (+{percent:.2f}%)"
+    else:
+        return f" ({percent:.2f}%)"
+
+def build_alert_message(symbol, alert_type, candle, extrema, previous_price):
+    """
+    알림 메시지 작성 (기간별 최고가/최저가 포함)
+
+    당일 레코드는 이미 현재가로 갱신되어 있으므로 기간별 가격은
+    당일을 제외한 요약 값과 갱신 직전 당일 고가/저가를 합쳐 계산
+
+    Args:
+        symbol: 'BTC', 'XRP', 'ETH'
+        alert_type: 'HIGH' 또는 'LOW'
+        candle: 최신 캔들 데이터
+        extrema: get_rolling_extrema로 조회한 기간별 최고가/최저가 (당일 제외)
+        previous_price: 갱신 직전 당일 고가(HIGH) 또는 저가(LOW)
+
+    Returns:
+        str: 텔레그램 HTML 메시지
+    """
+    current_price = candle['trade_price']
+
+    if alert_type == 'HIGH':
+        alert_text = "🟥 당일 고가 갱신"
+        pick, key = max, 'high'
+        period_label = "최고가"
+    else:
+        alert_text = "🟦 당일 저가 갱신"
+        pick, key = min, 'low'
+        period_label = "최저가"
+
+    lines = [
+        f"<b>{alert_text}</b>",
+        f"<b>종목코드: {symbol}</b>",
+        f"현재가: {current_price:,.0f}원"
+    ]
+
+    for days in ALERT_PERIODS:
+        prices = [price for price in (extrema[days][key], previous_price) if price is not None]
+        period_price = pick(prices) if prices else None
+
+        # 기간별 가격 포맷팅 + 퍼센트 차이 계산
+        price_str = f"{period_price:,.0f}" if period_price is not None else "N/A"
+        diff = format_percent_diff(current_price, period_price)
+        lines.append(f"{days}일{period_label}: {price_str}원{diff}")
+
+    # 메시지 작성
+    lines.append("")
+    lines.append(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    return "\n".join(lines)
+
+
+def send_alerts(alerts, telegram, db, executor=None):
+    """
+    process_symbol이 반환한 알림 전송 (저장 커밋 후 호출)
+
+    Args:
+        alerts: [(symbol, 알림 유형, 캔들 데이터, 직전 가격), ...]
+        telegram: TelegramUtil 인스턴스
+        db: DatabaseUtil 인스턴스
+        executor: 병렬 전송용 ThreadPoolExecutor (None이면 순차 전송)
+    """
+    if executor is not None:
+        futures = [
+            executor.submit(send_alert, symbol, alert_type, candle, db, telegram, previous_price)
+            for symbol, alert_type, candle, previous_price in alerts
+        ]
+        for future in futures:
+            future.result()
+    else:
+        for symbol, alert_type, candle, previous_price in alerts:
+            send_alert(symbol, alert_type, candle, db, telegram, previous_price)
+
+
+def send_alert(symbol, alert_type, candle, db, telegram, previous_price):
+    """
+    텔레그램 알림 전송 (텍스트 + 차트)
+    """
+    candle_date = candle['candle_date_time_kst'][:10]
+    extrema = db.get_rolling_extrema(symbol, base_date=candle_date)
+    message = build_alert_message(symbol, alert_type, candle, extrema, previous_price)
+
+    try:
+        # 차트 생성 (DB에서 최근 365일 데이터 조회 - 120일 이동평균선 계산용)
+        candles = db.get_period_candles(symbol, days=365, base_date=candle_date)
+        if candles:
+            chart_image = get_chart_image(symbol, candles)
+        else:
+            chart_image = None
+
+        if chart_image is not None:
+            telegram.send_photo(chart_image, caption=message)
+        else:
+            telegram.send_message(message)
+            
+        logger.info(f"[{symbol}] 알림 전송 완료")
+    except Exception as e:
+        error_msg = f"⚠️ [{symbol}] 알림 전송 중 오류 발생: {str(e)}"
+        logger.error(error_msg)
+        try:
+            telegram.send_test_message(error_msg)
+        except:
+            pass
+
+
+async def request_bithumb_async(session, semaphore, url, params):
+    """
+    빗썸 API 비동기 GET 요청 (request_bithumb의 비동기 버전, 동일한 재시도/회로 차단 적용)
+
+    세마포어로 동시에 진행 중인 요청 수를 ASYNC_CONCURRENCY개로 제한
+    (시도당 타임아웃은 BITHUMB_REQUEST_TIMEOUT, 세션 기본값보다 짧게 적용)
+    """
+    headers = {"accept": "application/json"}
+    host = urlparse(url).netloc
+    breaker = get_circuit_breaker(host)
+    started_at = time.monotonic()
+    failures = 0
+    rate_limited = 0
+
+    while True:
+        if not breaker.allow_request():
+            api_stats.record(host, 'short_circuited')
+            raise CircuitOpenError(host)
+
+        await bithumb_limiter.acquire_async()
+        api_stats.record(host, 'requests')
+
+        try:
+            async with semaphore:
+                async with session.get(url, params=params, headers=headers,
+                                       timeout=BITHUMB_REQUEST_TIMEOUT_ASYNC) as response:
+                    if response.status == 429 and rate_limited < RATE_LIMIT_MAX_RETRIES:
+                        delay = get_retry_after(response.headers, rate_limited)
+                    else:
+                        if response.status < 500:
+                            breaker.record_success()
+                            if response.status >= 400:
+                                api_stats.record(host, 'failures')
+                        response.raise_for_status()
+                        data = await response.json()
+                        api_stats.record(host, 'successes')
+                        return data
+        except aiohttp.ClientResponseError as e:
+            if e.status < 500:
+                raise
+            error = e
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+            error = e
+        except BaseException:
+            # 그 밖의 예외(취소 포함)도 실패로 기록 (half_open 시험 요청이 결과 없이 끝나지 않도록)
+            api_stats.record(host, 'failures')
+            breaker.record_failure()
+            raise
+        else:
+            # 속도 제한은 장애가 아니므로 회로 차단기에는 정상 응답으로 기록
+            breaker.record_success()
+            rate_limited += 1
+            api_stats.record(host, 'retries')
+            logger.warning(f"빗썸 API 요청 한도 초과(429) - {delay:.1f}초 후 재시도")
+            bithumb_limiter.backoff(delay)
+            continue
+
+        failures += 1
+        delay = record_request_failure(host, breaker, error, failures, started_at)
+        if delay is None:
+            raise error
+        await asyncio.sleep(delay)
+
+
+async def get_latest_daily_candle_async(session, semaphore, symbol):
+    """
+    오늘 일간 캔들 데이터 조회 (get_latest_daily_candle의 비동기 버전)
+
+    Returns:
+        캔들 데이터, 실패 시 None
+    """
+    url = "https://api.bithumb.com/v1/candles/days"
+    params = {
+        'count': 1,
+        'market': f'KRW-{symbol}'
+    }
+
+    try:
+        data = await request_bithumb_async(session, semaphore, url, params)
+
+        if not isinstance(data, list) or len(data) == 0:
+            logger.error(f"[{symbol}] 예상하지 못한 API 응답 형식: {type(data)}")
+            return None
+
+        return parse_daily_candle(data[0])
+    except Exception as e:
+        logger.error(f"[{symbol}] 일간 캔들 조회 실패: {str(e)}")
+        return None
+
+
+async def get_latest_daily_candles_async(session, semaphore, symbols):
+    """
+    여러 종목의 오늘 일간 캔들 데이터 일괄 조회 (get_latest_daily_candles의 비동기 버전)
+
+    TICKER_CHUNK_SIZE개씩 나눈 묶음 요청을 동시에 실행
+
+    Returns:
+        dict: {symbol: 캔들 데이터}
+    """
+    url = "https://api.bithumb.com/v1/ticker"
+
+    async def fetch_chunk(chunk):
+        params = {
+            'markets': ','.join(f'KRW-{symbol}' for symbol in chunk)
+        }
+        try:
+            data = await request_bithumb_async(session, semaphore, url, params)
+
+            if not isinstance(data, list):
+                logger.error(f"현재가 일괄 조회 - 예상하지 못한 API 응답 형식: {type(data)}")
+                return []
+
+            return [parse_ticker(ticker) for ticker in data]
+        except Exception as e:
+            logger.error(f"현재가 일괄 조회 실패 ({', '.join(chunk)}): {str(e)}")
+            return []
+
+    chunks = [symbols[i:i + TICKER_CHUNK_SIZE] for i in range(0, len(symbols), TICKER_CHUNK_SIZE)]
+    chunk_results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+    results = {}
+    for chunk_result in chunk_results:
+        results.update(chunk_result)
+
+    logger.info(f"현재가 일괄 조회 완료: {len(results)}/{len(symbols)}개 종목")
+    return results
+
+
+async def send_alert_async(symbol, alert_type, candle, db, telegram, previous_price, session, semaphore):
+    """
+    텔레그램 알림 전송 (send_alert의 비동기 버전)
+
+    차트 생성은 CPU 작업이므로 기본 스레드 풀에서 실행하고 (렌더링 워커가 있으면 워커 결과 대기),
+    업로드는 aiohttp 세션으로 전송
+    """
+    candle_date = candle['candle_date_time_kst'][:10]
+    extrema = db.get_rolling_extrema(symbol, base_date=candle_date)
+    message = build_alert_message(symbol, alert_type, candle, extrema, previous_price)
+
+    try:
+        candles = db.get_period_candles(symbol, days=365, base_date=candle_date)
+        if candles:
+            loop = asyncio.get_running_loop()
+            # 스레드 풀에서 그리는 동안 캐시 버퍼가 갱신될 수 있으므로 복사본 전달
+            chart_image = await loop.run_in_executor(None, get_chart_image, symbol, candles.copy())
+        else:
+            chart_image = None
+
+        async with semaphore:
+            if chart_image is not None:
+                await telegram.send_photo_async(session, chart_image, caption=message)
+            else:
+                await telegram.send_message_async(session, message)
+
+        logger.info(f"[{symbol}] 알림 전송 완료")
+    except Exception as e:
+        error_msg = f"⚠️ [{symbol}] 알림 전송 중 오류 발생: {str(e)}"
+        logger.error(error_msg)
+        try:
+            await telegram.send_test_message_async(session, error_msg)
+        except:
+            pass
+
+
+async def process_symbol_async(symbol, db, session, semaphore, candle=None):
+    """
+    단일 종목 처리 (process_symbol의 비동기 버전, 동일한 알림 판단 로직 사용)
+
+    Returns:
+        list: [(symbol, 알림 유형, 캔들 데이터, 직전 가격), ...] - 커밋 후 send_alerts_async로 전송
+    """
+    logger.info(f"[{symbol}] 처리 시작")
+
+    if candle is None:
+        candle = await get_latest_daily_candle_async(session, semaphore, symbol)
+    if candle is None:
+        logger.warning(f"[{symbol}] API 호출 실패 - 건너뜀")
+        return []
+
+    previous_prices, alert_types = save_candle(symbol, candle, db)
+
+    return [(symbol, alert_type, candle, previous_prices[alert_type]) for alert_type in alert_types]
+
+
+async def send_alerts_async(alerts, telegram, db, session, semaphore):
+    """process_symbol_async가 반환한 알림 동시 전송 (저장 커밋 후 호출)"""
+    await asyncio.gather(*(
+        send_alert_async(symbol, alert_type, candle, db, telegram, previous_price, session, semaphore)
+        for symbol, alert_type, candle, previous_price in alerts
+    ))
+
+
+async def stream_tickers(session, symbols, on_tick):
+    """
+    빗썸 웹소켓 ticker 구독
+
+    수신한 ticker마다 on_tick(symbol, candle) 호출.
+    연결이 끊기면 WS_RECONNECT_MIN_DELAY초부터 2배씩 늘려가며 재연결 후 재구독
+    (취소될 때까지 반복)
+
+    Args:
+        session: aiohttp ClientSession
+        symbols: 구독할 종목 리스트
+        on_tick: ticker 수신 콜백
+    """
+    subscribe_message = [
+        {"ticket": f"bithumb-price-monitor-{uuid.uuid4()}"},
+        {"type": "ticker", "codes": [f"KRW-{symbol}" for symbol in symbols]},
+        {"format": "DEFAULT"}
+    ]
+    delay = WS_RECONNECT_MIN_DELAY
+
+    while True:
+        try:
+            async with session.ws_connect(BITHUMB_WS_URL, heartbeat=30) as ws:
+                await ws.send_json(subscribe_message)
+                logger.info(f"웹소켓 구독 시작: {len(symbols)}개 종목")
+                delay = WS_RECONNECT_MIN_DELAY
+
+                async for msg in ws:
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        data = json.loads(msg.data)
+                        if data.get('type') == 'ticker':
+                            on_tick(*parse_ws_ticker(data))
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        break
+
+            logger.warning("웹소켓 연결 종료")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"웹소켓 오류: {str(e)}")
+
+        logger.info(f"웹소켓 {delay}초 후 재연결")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+
+
+def compact_tick_log(db, symbols):
+    """
+    보존 기간이 지난 체결가를 1분/1시간 봉으로 압축 후 삭제하고 보존 기간이 지난 봉 삭제
+
+    압축 기준 시각은 정시로 맞춰 1분/1시간 봉이 압축 회차 사이에 나뉘지 않게 함
+
+    Args:
+        db: DatabaseUtil 인스턴스
+        symbols: 대상 종목 리스트
+    """
+    now = int(time.time())
+    tick_cutoff = (now - TICK_RETENTION_HOURS * 3600) // 3600 * 3600
+    bar_cutoffs = {
+        '1m': now - MINUTE_BAR_RETENTION_DAYS * 86400,
+        '1h': now - HOUR_BAR_RETENTION_DAYS * 86400
+    }
+
+    compacted = 0
+    for symbol in symbols:
+        try:
+            compacted += db.compact_ticks(symbol, tick_cutoff * 1000, bar_cutoffs)
+        except Exception as e:
+            logger.error(f"[{symbol}] 체결가 압축 실패: {str(e)}")
+
+    if compacted:
+        logger.info(f"체결가 압축 완료: {compacted}건 -> 1분/1시간 봉")
+
+
+def run_cycle(monitored_symbols, telegram, db, executor=None):
+    """
+    1회 모니터링 사이클 실행
+
+    현재가 일괄 조회 후 각 코인 처리 (일괄 조회에서 빠진 종목은 개별 조회)
+
+    Args:
+        monitored_symbols: 모니터링 대상 종목 리스트
+        telegram: TelegramUtil 인스턴스
+        db: DatabaseUtil 인스턴스
+        executor: 종목별 병렬 처리용 ThreadPoolExecutor (None이면 순차 처리)
+    """
+    if not monitored_symbols:
+        return
+
+    candles = get_latest_daily_candles(monitored_symbols)
+
+    # 사이클 내 전 종목 캔들 저장을 한 트랜잭션으로 커밋 (알림은 커밋 후 트랜잭션 밖에서 전송)
+    alerts = []
+    with db.transaction():
+        if executor is not None:
+            # 워커 풀에서 종목별 병렬 처리 (DB 접근은 DatabaseUtil 락으로 직렬화)
+            futures = [
+                executor.submit(process_symbol, symbol, db, candles.get(symbol))
+                for symbol in monitored_symbols
+            ]
+            for future in futures:
+                alerts.extend(future.result())
+        else:
+            for symbol in monitored_symbols:
+                alerts.extend(process_symbol(symbol, db, candle=candles.get(symbol)))
+
+    send_alerts(alerts, telegram, db, executor)
+
+    log_api_stats()
+    log_cache_stats(db)
+
+
+def main():
+    """메인 실행 함수"""
+
+    # 1. 환경변수 검증
+    validate_env()
+
+    # 2. 초기화
+    telegram = TelegramUtil(timeout=REQUEST_TIMEOUT)
+    db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, extrema_periods=ALERT_PERIODS)
+
+    # 환경변수에서 모니터링 코인 가져오기
+    monitored_symbols = get_monitored_symbols()
+
+    logger.info("=== 빗썸 가격 모니터 시작 ===")
+    logger.info(f"모니터링 대상: {', '.join(monitored_symbols)}")
+
+    # 3. DB 연결
+    db.connect()
+
+    # 4. 각 종목 테이블 초기화 + 이력 백필 (백그라운드 병렬 실행)
+    backfill_db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, busy_timeout=BACKFILL_BUSY_TIMEOUT)
+    backfill_db.connect()
+    backfill_executor = ThreadPoolExecutor(max_workers=BACKFILL_WORKERS)
+    backfills = start_backfill(monitored_symbols, db, backfill_db, backfill_executor)
+
+    # 5. 각 코인 처리 (기존 종목은 바로, 신규 종목은 백필 완료 후)
+    executor = None
+    if MAX_WORKERS > 1:
+        logger.info(f"동시 처리 모드: 워커 {MAX_WORKERS}개")
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    try:
+        ready_symbols = get_ready_symbols(monitored_symbols, backfills)
+        run_cycle(ready_symbols, telegram, db, executor)
+
+        for future in backfills.values():
+            future.result()
+        run_cycle([s for s in monitored_symbols if s not in ready_symbols], telegram, db, executor)
+        compact_tick_log(db, monitored_symbols)
+    finally:
+        backfill_executor.shutdown(wait=True)
+        backfill_db.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     # 6. 종료
     db.close()
     logger.info("=== 빗썸 가격 모니터 완료 ===")
 
+
+def run_daemon():
+    """
+    상주(데몬) 실행 함수
+
+    프로세스, DB 연결, HTTP 세션, 워커 풀을 유지한 채
+    POLL_INTERVAL_SECONDS 간격으로 모니터링 사이클 반복 실행
+    - 단조 시계(time.monotonic) 기준 고정 스케줄이라 실행 시간만큼 밀리지 않음
+    - 사이클이 주기보다 오래 걸리면 놓친 회차는 건너뜀
+    - SIGTERM/SIGINT 수신 시 진행 중인 사이클을 마치고 종료
+    """
+
+    # 1. 환경변수 검증
+    validate_env()
+
+    # 2. 초기화
+    telegram = TelegramUtil(timeout=REQUEST_TIMEOUT)
+    monitored_symbols = get_monitored_symbols()
+    db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, extrema_periods=ALERT_PERIODS,
+                      cache_max_rows=get_candle_cache_max_rows(monitored_symbols))
+
+    logger.info(f"=== 빗썸 가격 모니터 시작 (데몬 모드, 주기: {POLL_INTERVAL_SECONDS}초) ===")
+    logger.info(f"모니터링 대상: {', '.join(monitored_symbols)}")
+
+    # 3. DB 연결
+    db.connect()
+
+    # 4. 각 종목 테이블 초기화 + 이력 백필 (백그라운드 병렬 실행, 완료된 종목부터 모니터링)
+    backfill_db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, busy_timeout=BACKFILL_BUSY_TIMEOUT)
+    backfill_db.connect()
+    backfill_executor = ThreadPoolExecutor(max_workers=BACKFILL_WORKERS)
+    backfills = start_backfill(monitored_symbols, db, backfill_db, backfill_executor)
+    backfill_date = datetime.now(KST).date()
+
+    # 5. 종료 시그널 처리
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info(f"종료 시그널 수신 ({signal.Signals(signum).name}) - 현재 사이클 완료 후 종료")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    # 6. 주기 실행 (차트 렌더링은 워커 프로세스에서)
+    start_chart_renderer()
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS) if MAX_WORKERS > 1 else None
+    next_run = time.monotonic()
+    next_compact = next_run + TICK_COMPACT_INTERVAL
+
+    try:
+        while not stop_event.is_set():
+            # KST 날짜가 바뀌면 전날 캔들까지 이력 증분 백필
+            backfill_date = refresh_backfill(backfill_date, monitored_symbols, db, backfill_db, backfill_executor, backfills)
+
+            try:
+                run_cycle(get_ready_symbols(monitored_symbols, backfills), telegram, db, executor)
+            except Exception as e:
+                # 사이클 단위 오류는 기록 후 다음 사이클 계속
+                logger.error(f"모니터링 사이클 오류: {str(e)}", exc_info=True)
+
+            # 체결가 압축은 사이클 사이에 TICK_COMPACT_INTERVAL마다 실행
+            if time.monotonic() >= next_compact:
+                compact_tick_log(db, monitored_symbols)
+                next_compact = time.monotonic() + TICK_COMPACT_INTERVAL
+
+            next_run += POLL_INTERVAL_SECONDS
+            now = time.monotonic()
+            if next_run < now:
+                skipped = int((now - next_run) // POLL_INTERVAL_SECONDS) + 1
+                next_run += skipped * POLL_INTERVAL_SECONDS
+                logger.warning(f"사이클 실행 시간이 주기를 초과하여 {skipped}회 건너뜀")
+
+            stop_event.wait(next_run - now)
+    finally:
+        # 7. 종료 (대기 중인 백필은 취소)
+        backfill_executor.shutdown(wait=True, cancel_futures=True)
+        backfill_db.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        stop_chart_renderer()
+        db.close()
+        logger.info("=== 빗썸 가격 모니터 종료 (데몬 모드) ===")
+
+async def main_async():
+    """비동기 메인 실행 함수 (asyncio + aiohttp)"""
+
+    # 1. 환경변수 검증
+    validate_env()
+
+    # 2. 초기화
+    telegram = TelegramUtil(timeout=REQUEST_TIMEOUT)
+    db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, extrema_periods=ALERT_PERIODS)
+    monitored_symbols = get_monitored_symbols()
+
+    logger.info("=== 빗썸 가격 모니터 시작 (비동기 모드) ===")
+    logger.info(f"모니터링 대상: {', '.join(monitored_symbols)}")
+
+    # 3. DB 연결
+    db.connect()
+
+    # 4. 각 종목 테이블 초기화 + 이력 백필 (백그라운드 병렬 실행)
+    backfill_db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, busy_timeout=BACKFILL_BUSY_TIMEOUT)
+    backfill_db.connect()
+    backfill_executor = ThreadPoolExecutor(max_workers=BACKFILL_WORKERS)
+    backfills = start_backfill(monitored_symbols, db, backfill_db, backfill_executor)
+
+    # 5. 현재가 일괄 조회 후 전 종목 동시 처리 (동시 요청 수는 세마포어로 제한)
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONCURRENCY)
+
+    async def process_symbols(symbols):
+        if not symbols:
+            return
+        candles = await get_latest_daily_candles_async(session, semaphore, symbols)
+        # 저장은 한 트랜잭션으로 커밋하고 알림은 커밋 후 전송
+        with db.transaction():
+            results = await asyncio.gather(*(
+                process_symbol_async(symbol, db, session, semaphore, candles.get(symbol))
+                for symbol in symbols
+            ))
+        await send_alerts_async([alert for alerts in results for alert in alerts], telegram, db, session, semaphore)
+
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        # 기존 종목은 바로, 신규 종목은 백필 완료 후 처리
+        ready_symbols = get_ready_symbols(monitored_symbols, backfills)
+        await process_symbols(ready_symbols)
+
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in backfills.values()))
+        await process_symbols([s for s in monitored_symbols if s not in ready_symbols])
+
+    compact_tick_log(db, monitored_symbols)
+
+    # 6. 종료
+    log_api_stats()
+    log_cache_stats(db)
+    backfill_executor.shutdown(wait=True)
+    backfill_db.close()
+    db.close()
+    logger.info("=== 빗썸 가격 모니터 완료 ===")
+
+async def main_stream():
+    """
+    웹소켓 스트리밍 실행 함수
+
+    빗썸 공개 웹소켓 ticker를 구독하여 체결마다 process_symbol과 동일한
+    고가/저가 갱신 판단을 수행 (폴링 사이에 놓치던 장중 고가/저가 감지)
+    - 종목별 워커가 가장 최근 ticker만 처리 (알림 전송 중 쌓인 ticker는 최신 것으로 대체)
+    - 가격(현재가/고가/저가) 변동이 없는 ticker는 건너뜀
+    - SIGTERM/SIGINT 수신 시 종료
+    """
+
+    # 1. 환경변수 검증
+    validate_env()
+
+    # 2. 초기화
+    telegram = TelegramUtil(timeout=REQUEST_TIMEOUT)
+    monitored_symbols = get_monitored_symbols()
+    db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, extrema_periods=ALERT_PERIODS,
+                      cache_max_rows=get_candle_cache_max_rows(monitored_symbols))
+
+    logger.info("=== 빗썸 가격 모니터 시작 (스트리밍 모드) ===")
+    logger.info(f"모니터링 대상: {', '.join(monitored_symbols)}")
+
+    # 3. DB 연결
+    db.connect()
+
+    # 4. 각 종목 테이블 초기화 + 이력 백필 (백그라운드 병렬 실행, 완료된 종목부터 처리)
+    backfill_db = DatabaseUtil(DB_PATH, durability=DB_DURABILITY, busy_timeout=BACKFILL_BUSY_TIMEOUT)
+    backfill_db.connect()
+    backfill_executor = ThreadPoolExecutor(max_workers=BACKFILL_WORKERS)
+    backfills = start_backfill(monitored_symbols, db, backfill_db, backfill_executor)
+    backfill_date = datetime.now(KST).date()
+
+    # 5. 종료 시그널 처리
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    # 6. 종목별 최신 ticker 슬롯과 처리 워커
+    pending = {}
+    wakeups = {symbol: asyncio.Event() for symbol in monitored_symbols}
+    last_prices = {}
+
+    def on_tick(symbol, candle):
+        if symbol not in wakeups:
+            return
+        if symbol in backfills and not backfills[symbol].done():
+            return
+
+        prices = (candle['trade_price'], candle['high_price'], candle['low_price'])
+        if last_prices.get(symbol) == prices:
+            return
+        last_prices[symbol] = prices
+
+        pending[symbol] = candle
+        wakeups[symbol].set()
+
+    async def symbol_worker(symbol, session, semaphore):
+        while True:
+            await wakeups[symbol].wait()
+            wakeups[symbol].clear()
+            candle = pending.pop(symbol)
+            try:
+                alerts = await process_symbol_async(symbol, db, session, semaphore, candle)
+                if alerts:
+                    # 알림 전에 저장을 커밋 (전송 동안 쓰기 잠금을 잡고 있지 않음)
+                    db.commit()
+                    await send_alerts_async(alerts, telegram, db, session, semaphore)
+            except Exception as e:
+                logger.error(f"[{symbol}] ticker 처리 오류: {str(e)}", exc_info=True)
+
+    async def commit_worker():
+        while True:
+            await asyncio.sleep(STREAM_COMMIT_INTERVAL)
+            db.commit()
+
+    async def compact_worker():
+        # 압축 중에도 ticker 수신이 멈추지 않도록 스레드에서 실행
+        while True:
+            await asyncio.sleep(TICK_COMPACT_INTERVAL)
+            await loop.run_in_executor(None, compact_tick_log, db, monitored_symbols)
+
+    async def backfill_worker(backfill_date):
+        # KST 날짜가 바뀌면 전날 캔들까지 이력 증분 백필 (백필 자체는 backfill_executor에서 실행)
+        while True:
+            await asyncio.sleep(BACKFILL_CHECK_INTERVAL)
+            backfill_date = refresh_backfill(backfill_date, monitored_symbols, db, backfill_db, backfill_executor, backfills)
+
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+    # 차트 렌더링은 워커 프로세스에서 (이벤트 루프와 다른 종목 처리를 막지 않음)
+    start_chart_renderer()
+
+    # ticker별 캔들 저장은 STREAM_COMMIT_INTERVAL마다 모아서 커밋 (종료 시 남은 쓰기 커밋)
+    with db.transaction():
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            tasks = [asyncio.create_task(symbol_worker(symbol, session, semaphore)) for symbol in monitored_symbols]
+            tasks.append(asyncio.create_task(stream_tickers(session, monitored_symbols, on_tick)))
+            tasks.append(asyncio.create_task(commit_worker()))
+            tasks.append(asyncio.create_task(compact_worker()))
+            tasks.append(asyncio.create_task(backfill_worker(backfill_date)))
+
+            await stop_event.wait()
+            logger.info("종료 시그널 수신 - 스트리밍 종료")
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 7. 종료 (대기 중인 백필은 취소)
+    log_api_stats()
+    log_cache_stats(db)
+    stop_chart_renderer()
+    backfill_executor.shutdown(wait=True, cancel_futures=True)
+    backfill_db.close()
+    db.close()
+    logger.info("=== 빗썸 가격 모니터 종료 (스트리밍 모드) ===")
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="빗썸 가격 모니터")
+    parser.add_argument('--mode', choices=['sync', 'async', 'daemon', 'stream'], default='sync',
+                        help="실행 모드 (sync: 1회 동기 처리, async: asyncio 동시 처리, "
+                             "daemon: 상주하며 주기 실행, stream: 웹소켓 실시간 처리)")
+    args = parser.parse_args()
+
     try:
-        main()
+        if args.mode == 'async':
+            asyncio.run(main_async())
+        elif args.mode == 'daemon':
+            run_daemon()
+        elif args.mode == 'stream':
+            asyncio.run(main_stream())
+        else:
+            main()
     except Exception as e:
         logger.error(f"치명적 오류: {str(e)}", exc_info=True)
         
         try:
-            telegram = TelegramUtil()
+            telegram = TelegramUtil(timeout=REQUEST_TIMEOUT)
             error_msg = f"🚨 치명적 오류 발생\n\n{str(e)}\n\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
             telegram.send_test_message(error_msg)
         except:
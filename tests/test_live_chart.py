@@ -0,0 +1,76 @@
+import io
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+# 증분 렌더링은 mplfinance가 그린 figure 구조에 의존하므로 실제 mplfinance로만 검증
+pytest.importorskip('mplfinance')
+
+import matplotlib.image as mimage
+
+import main
+from utils.candle_array_util import CandleArray
+from utils.chart_util import LiveChartCache
+
+
+class FixedDatetime(datetime):
+    """차트 생성 시각 고정 (렌더링 결과 비교용)"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 16, 12, 0, 0, tzinfo=tz)
+
+
+def make_candles(today_close, days=200):
+    """80~120 사이를 오가는 일봉 + 당일 일봉 (당일 값은 배경 축 범위 안)"""
+    rows = []
+    first = date(2026, 10, 16) - timedelta(days=days - 1)
+    for i in range(days - 1):
+        close = 100 + 20 * np.sin(i / 9)
+        open_price = 100 + 20 * np.sin((i - 1) / 9)
+        rows.append((
+            (first + timedelta(days=i)).isoformat(),
+            open_price, max(open_price, close) + 1, min(open_price, close) - 1, close, 5 + (i % 5)
+        ))
+
+    previous_close = rows[-1][4]
+    rows.append((
+        date(2026, 10, 16).isoformat(),
+        previous_close, max(previous_close, today_close) + 0.5, min(previous_close, today_close) - 0.5, today_close, 2
+    ))
+    return CandleArray.from_rows(rows)
+
+
+def decode(image):
+    return mimage.imread(io.BytesIO(image), format='png')
+
+
+@pytest.fixture
+def chart_env(monkeypatch):
+    monkeypatch.setattr(main, 'datetime', FixedDatetime)
+    monkeypatch.setattr(main, 'CHART_SAVE_TO_DISK', False)
+
+
+def test_background_reuse_matches_fresh_build(chart_env, monkeypatch):
+    monkeypatch.setattr(main, 'live_charts', LiveChartCache(4))
+    main.create_chart('BTC', make_candles(100.5))
+    reused = main.create_chart('BTC', make_candles(101.0))
+    assert main.live_charts.hits == 1
+
+    # 같은 입력을 배경 없이 새로 그린 결과와 픽셀 단위로 같아야 함
+    monkeypatch.setattr(main, 'live_charts', LiveChartCache(4))
+    fresh = main.create_chart('BTC', make_candles(101.0))
+    assert main.live_charts.misses == 1
+
+    reused_pixels, fresh_pixels = decode(reused), decode(fresh)
+    assert reused_pixels.shape == fresh_pixels.shape
+    assert np.array_equal(reused_pixels, fresh_pixels)
+
+
+def test_full_render_without_background_cache(chart_env, monkeypatch):
+    monkeypatch.setattr(main, 'live_charts', LiveChartCache(0))
+    image = main.create_chart('BTC', make_candles(101.0))
+
+    assert decode(image).ndim == 3
+    assert not main.live_charts.entries
@@ -0,0 +1,94 @@
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from utils.db_util import DatabaseUtil
+
+# 10년치 일봉 x 종목 수
+YEARS = 10
+SYMBOLS = [f'C{index:02d}' for index in range(20)]
+BASE_DATE = date(2026, 10, 16)
+
+# 기간 조회가 (symbol, reg_date) 기본키 범위 검색으로 처리될 때의 실행 계획
+RANGE_PLAN = 'SEARCH bp_candles USING PRIMARY KEY (symbol=? AND reg_date>? AND reg_date<?)'
+
+
+@pytest.fixture(scope='module')
+def db(tmp_path_factory):
+    """10년치 bp_candles 테이블 (요약/일봉 캐시 없이 항상 SQL로 조회)"""
+    db = DatabaseUtil(str(tmp_path_factory.mktemp('bench') / 'bench.db'), durability='fast')
+    db.connect()
+
+    days = YEARS * 365
+    first = BASE_DATE - timedelta(days=days - 1)
+    rows = (
+        (symbol, (first + timedelta(days=day)).isoformat(), 100.0, 101.0, 102.0 + day % 7, 99.0 - day % 5, 10.0)
+        for symbol in SYMBOLS
+        for day in range(days)
+    )
+    db.bulk_insert_rows(rows)
+
+    yield db
+    db.close()
+
+
+def capture_queries(db, call):
+    """call 실행 중 bp_candles를 조회한 SQL (바인딩 값이 채워진 문장) 수집"""
+    queries = []
+    db.conn.set_trace_callback(
+        lambda sql: queries.append(sql) if 'FROM bp_candles' in sql and sql.lstrip().startswith('SELECT') else None
+    )
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+    return queries
+
+
+def query_plan(db, sql):
+    return [row[3] for row in db.conn.execute(f'EXPLAIN QUERY PLAN {sql}')]
+
+
+def measure(call, runs=200):
+    """1회 평균 실행 시간 (마이크로초)"""
+    started_at = time.perf_counter()
+    for _ in range(runs):
+        call()
+    return (time.perf_counter() - started_at) / runs * 1e6
+
+
+@pytest.mark.parametrize('name, call', [
+    ('get_period_candles(365)', lambda db: db.get_period_candles('C07', 365, BASE_DATE.isoformat())),
+    ('get_period_extrema(5/20/60/120)', lambda db: db.get_period_extrema('C07', [5, 20, 60, 120], BASE_DATE.isoformat())),
+    ('get_period_extrema(exclude_base_date)',
+     lambda db: db.get_period_extrema('C07', [120], BASE_DATE.isoformat(), exclude_base_date=True)),
+])
+def test_period_queries_use_primary_key_range(db, name, call):
+    queries = capture_queries(db, lambda: call(db))
+    assert queries
+
+    for sql in queries:
+        assert query_plan(db, sql) == [RANGE_PLAN]
+
+    elapsed = measure(lambda: call(db))
+    print(f"\n{name}: {len(SYMBOLS) * YEARS * 365:,}행 중 {elapsed:,.1f}us/query ({RANGE_PLAN})")
+
+
+def test_range_is_faster_than_date_function_filter(db):
+    """이전 DATE(reg_date) 필터(기본키의 symbol만 사용)와 비교"""
+    start_date = (BASE_DATE - timedelta(days=120)).isoformat()
+    range_sql = 'SELECT MAX(high_price) FROM bp_candles WHERE symbol = ? AND reg_date >= ? AND reg_date <= ?'
+    date_sql = 'SELECT MAX(high_price) FROM bp_candles WHERE symbol = ? AND DATE(reg_date) >= DATE(?)'
+
+    range_params = ('C07', start_date, BASE_DATE.isoformat())
+    date_params = ('C07', start_date)
+    date_plan = [row[3] for row in db.conn.execute(f'EXPLAIN QUERY PLAN {date_sql}', date_params)]
+    assert [row[3] for row in db.conn.execute(f'EXPLAIN QUERY PLAN {range_sql}', range_params)] == [RANGE_PLAN]
+
+    range_elapsed = measure(lambda: db.conn.execute(range_sql, range_params).fetchone())
+    date_elapsed = measure(lambda: db.conn.execute(date_sql, date_params).fetchone())
+    print(f"\n120일 최고가 - 범위 조건: {range_elapsed:,.1f}us/query ({RANGE_PLAN})")
+    print(f"120일 최고가 - DATE() 조건: {date_elapsed:,.1f}us/query ({date_plan[0]})")
+
+    assert range_elapsed < date_elapsed
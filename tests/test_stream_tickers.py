@@ -0,0 +1,148 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import main
+
+
+# 2026-10-16 12:00:00 KST (UTC로도 같은 날짜)
+KST_NOON = 1792119600000
+# 2026-10-16 03:30:00 KST (UTC로는 전날 18:30)
+KST_EARLY_MORNING = 1792089000000
+
+
+def make_ticker(code, trade_price, trade_timestamp=KST_NOON):
+    """빗썸 웹소켓 ticker 메시지 (DEFAULT 포맷, trade_date/trade_time은 거래소와 같이 UTC 기준)"""
+    traded_at = datetime.fromtimestamp(trade_timestamp / 1000, timezone.utc)
+    return {
+        'type': 'ticker',
+        'code': code,
+        'opening_price': 100.0,
+        'trade_price': trade_price,
+        'high_price': 120.0,
+        'low_price': 90.0,
+        'acc_trade_volume': 12.5,
+        'trade_date': traded_at.strftime('%Y%m%d'),
+        'trade_time': traded_at.strftime('%H%M%S'),
+        'trade_timestamp': trade_timestamp
+    }
+
+
+class ReplayServer:
+    """
+    연결마다 준비된 메시지를 재생하는 웹소켓 서버
+
+    - 연결마다 구독 메시지를 기록한 뒤 sessions[연결 순번] 메시지를 전송
+    - 마지막 세션이 아니면 전송 후 연결을 끊어 재연결을 유도
+    """
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+        self.subscriptions = []
+        self.app = web.Application()
+        self.app.router.add_get('/websocket/v1', self.handle)
+
+    async def handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        index = len(self.subscriptions)
+        self.subscriptions.append(await ws.receive_json())
+
+        for message in self.sessions[min(index, len(self.sessions) - 1)]:
+            # 빗썸은 ticker를 바이너리 프레임으로 전송
+            await ws.send_bytes(json.dumps(message).encode())
+
+        if index < len(self.sessions) - 1:
+            await ws.close()
+        else:
+            async for _ in ws:
+                pass
+        return ws
+
+
+def run_stream(monkeypatch, sessions, expected_ticks):
+    """재생 서버에 stream_tickers를 연결하고 ticker expected_ticks개를 받으면 종료"""
+    monkeypatch.setattr(main, 'WS_RECONNECT_MIN_DELAY', 0.01)
+
+    async def scenario():
+        replay = ReplayServer(sessions)
+        server = TestServer(replay.app)
+        await server.start_server()
+        monkeypatch.setattr(main, 'BITHUMB_WS_URL', str(server.make_url('/websocket/v1')))
+
+        ticks = []
+        done = asyncio.Event()
+
+        def on_tick(symbol, candle):
+            ticks.append((symbol, candle))
+            if len(ticks) >= expected_ticks:
+                done.set()
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                task = asyncio.create_task(main.stream_tickers(session, ['BTC', 'ETH'], on_tick))
+                await asyncio.wait_for(done.wait(), timeout=5)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        finally:
+            await server.close()
+
+        return replay.subscriptions, ticks
+
+    return asyncio.run(scenario())
+
+
+def test_parses_ticker_messages(monkeypatch):
+    sessions = [[
+        {'status': 'UP'},
+        make_ticker('KRW-BTC', 110.0),
+        make_ticker('KRW-ETH', 95.5)
+    ]]
+
+    subscriptions, ticks = run_stream(monkeypatch, sessions, expected_ticks=2)
+
+    assert [symbol for symbol, _ in ticks] == ['BTC', 'ETH']
+    symbol, candle = ticks[0]
+    assert candle == {
+        'opening_price': 100.0,
+        'trade_price': 110.0,
+        'high_price': 120.0,
+        'low_price': 90.0,
+        'candle_acc_trade_volume': 12.5,
+        'candle_date_time_kst': '2026-10-16 00:00:00',
+        'trade_timestamp': KST_NOON
+    }
+    assert subscriptions[0][1] == {'type': 'ticker', 'codes': ['KRW-BTC', 'KRW-ETH']}
+
+
+def test_uses_kst_date_before_9am(monkeypatch):
+    # KST 00:00~09:00 체결은 UTC trade_date가 전날이지만 캔들은 KST 당일로 저장되어야 함
+    sessions = [[make_ticker('KRW-BTC', 110.0, trade_timestamp=KST_EARLY_MORNING)]]
+
+    _, ticks = run_stream(monkeypatch, sessions, expected_ticks=1)
+
+    symbol, candle = ticks[0]
+    assert sessions[0][0]['trade_date'] == '20261015'
+    assert candle['candle_date_time_kst'] == '2026-10-16 00:00:00'
+
+
+def test_resubscribes_after_disconnect(monkeypatch):
+    sessions = [
+        [make_ticker('KRW-BTC', 110.0)],
+        [make_ticker('KRW-BTC', 111.0)],
+        [make_ticker('KRW-ETH', 96.0)]
+    ]
+
+    subscriptions, ticks = run_stream(monkeypatch, sessions, expected_ticks=3)
+
+    assert [(symbol, candle['trade_price']) for symbol, candle in ticks] == [
+        ('BTC', 110.0), ('BTC', 111.0), ('ETH', 96.0)
+    ]
+    # 끊길 때마다 같은 구독 메시지로 재구독
+    assert len(subscriptions) == 3
+    assert all(subscription == subscriptions[0] for subscription in subscriptions)
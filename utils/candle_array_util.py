@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+
+class CandleArray:
+    """
+    일봉 OHLCV 컬럼형 저장소 (list of dict 대체)
+
+    - 가격/거래량은 (5, capacity) float64 배열 하나에 컬럼별로 연속 저장, 날짜는 datetime64[s]
+    - 끝에 추가는 용량을 2배씩 늘려 분할 상환 O(1), 앞쪽 제거(trim)는 시작 위치만 이동하여 O(1)
+    - window/슬라이싱은 복사 없이 같은 버퍼를 보는 읽기 전용 뷰 반환
+    - to_dataframe은 복사 없이 pandas(mplfinance) DataFrame으로 변환
+
+    뷰와 to_dataframe 결과는 원본 버퍼를 공유하므로 이후 같은 날짜 갱신(append)이 반영됨
+    """
+
+    COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+    def __init__(self, capacity=16):
+        """
+        Args:
+            capacity: 초기 용량 (행 수)
+        """
+        capacity = max(1, capacity)
+        self._values = np.empty((len(self.COLUMNS), capacity), dtype=np.float64)
+        self._dates = np.empty(capacity, dtype='datetime64[s]')
+        self._start = 0
+        self._end = 0
+        self._readonly = False
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        (reg_date, open, high, low, close, volume) 행 목록으로 생성 (날짜 오름차순)
+
+        Args:
+            rows: reg_date는 'YYYY-MM-DD' 문자열
+        """
+        rows = list(rows)
+        array = cls(capacity=len(rows))
+        if rows:
+            array._dates[:len(rows)] = [row[0] for row in rows]
+            array._values[:, :len(rows)] = np.array([row[1:] for row in rows], dtype=np.float64).T
+            array._end = len(rows)
+        return array
+
+    def _view(self, start, end):
+        """[start, end) 구간을 공유하는 읽기 전용 뷰 생성 (절대 위치 기준)"""
+        view = CandleArray.__new__(CandleArray)
+        view._values = self._values[:, start:end]
+        view._dates = self._dates[start:end]
+        view._start = 0
+        view._end = end - start
+        view._readonly = True
+        return view
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        """행 위치 슬라이스 (읽기 전용 뷰, 복사 없음)"""
+        if not isinstance(index, slice):
+            raise TypeError("CandleArray는 슬라이스로만 접근 (컬럼은 open/high/low/close/volume 속성 사용)")
+
+        start, end, step = index.indices(len(self))
+        if step != 1:
+            raise ValueError("CandleArray 슬라이스는 step 1만 지원")
+        return self._view(self._start + start, self._start + max(start, end))
+
+    @property
+    def dates(self):
+        return self._dates[self._start:self._end]
+
+    @property
+    def open(self):
+        return self._values[self.OPEN, self._start:self._end]
+
+    @property
+    def high(self):
+        return self._values[self.HIGH, self._start:self._end]
+
+    @property
+    def low(self):
+        return self._values[self.LOW, self._start:self._end]
+
+    @property
+    def close(self):
+        return self._values[self.CLOSE, self._start:self._end]
+
+    @property
+    def volume(self):
+        return self._values[self.VOLUME, self._start:self._end]
+
+    @property
+    def last_date(self):
+        """마지막 행 날짜 'YYYY-MM-DD' (비어 있으면 None)"""
+        if not len(self):
+            return None
+        return str(self._dates[self._end - 1])[:10]
+
+    def _check_writable(self):
+        if self._readonly:
+            raise ValueError("CandleArray 뷰는 수정할 수 없음")
+
+    def _reserve(self):
+        """
+        끝에 한 행을 추가할 공간 확보 (가득 차면 현재 행 수의 2배 버퍼로 옮김)
+
+        기존 버퍼는 그대로 두므로 이미 만든 뷰는 계속 유효
+        """
+        if self._end < self._dates.shape[0]:
+            return
+
+        size = len(self)
+        capacity = max(size * 2, 16)
+        values = np.empty((len(self.COLUMNS), capacity), dtype=np.float64)
+        dates = np.empty(capacity, dtype='datetime64[s]')
+
+        values[:, :size] = self._values[:, self._start:self._end]
+        dates[:size] = self._dates[self._start:self._end]
+        self._values, self._dates = values, dates
+        self._start, self._end = 0, size
+
+    def append(self, reg_date, open_price, high_price, low_price, close_price, volume):
+        """
+        끝에 일봉 추가 (마지막 날짜와 같으면 그 행을 갱신)
+
+        Args:
+            reg_date: 'YYYY-MM-DD' (마지막 날짜 이후 또는 같은 날짜)
+
+        Raises:
+            ValueError: 마지막 날짜보다 이전 날짜
+        """
+        self._check_writable()
+        date = np.datetime64(reg_date, 's')
+
+        if len(self) and date <= self._dates[self._end - 1]:
+            if date < self._dates[self._end - 1]:
+                raise ValueError(f"CandleArray는 날짜 순서대로만 추가 가능: {reg_date}")
+            position = self._end - 1
+        else:
+            self._reserve()
+            position = self._end
+            self._end += 1
+
+        self._dates[position] = date
+        self._values[:, position] = (open_price, high_price, low_price, close_price, volume)
+
+    def set_row(self, reg_date, open_price, high_price, low_price, close_price, volume):
+        """
+        이미 있는 날짜의 행 갱신
+
+        Returns:
+            bool: 갱신했으면 True, 해당 날짜가 없으면 False
+        """
+        self._check_writable()
+        index = self.index_of(reg_date)
+        if index is None:
+            return False
+
+        self._values[:, self._start + index] = (open_price, high_price, low_price, close_price, volume)
+        return True
+
+    def trim(self, start_date):
+        """start_date 이전 행 제거 (시작 위치만 이동)"""
+        self._check_writable()
+        self._start += int(np.searchsorted(self.dates, np.datetime64(start_date, 's'), side='left'))
+
+    def index_of(self, reg_date):
+        """날짜의 행 위치 (없으면 None)"""
+        date = np.datetime64(reg_date, 's')
+        index = int(np.searchsorted(self.dates, date, side='left'))
+        if index < len(self) and self.dates[index] == date:
+            return index
+        return None
+
+    def window(self, start_date, end_date=None):
+        """
+        [start_date, end_date] 구간 읽기 전용 뷰 (복사 없음)
+
+        Args:
+            start_date: 'YYYY-MM-DD' (포함)
+            end_date: 'YYYY-MM-DD' (포함, None이면 끝까지)
+        """
+        dates = self.dates
+        start = int(np.searchsorted(dates, np.datetime64(start_date, 's'), side='left'))
+        end = len(self)
+        if end_date is not None:
+            end = int(np.searchsorted(dates, np.datetime64(end_date, 's'), side='right'))
+        return self._view(self._start + start, self._start + max(start, end))
+
+    def copy(self):
+        """버퍼를 공유하지 않는 수정 가능한 복사본"""
+        array = CandleArray(capacity=len(self))
+        array._values[:, :len(self)] = self._values[:, self._start:self._end]
+        array._dates[:len(self)] = self.dates
+        array._end = len(self)
+        return array
+
+    def to_dataframe(self):
+        """
+        pandas DataFrame 변환 (Date 인덱스, Open/High/Low/Close/Volume 컬럼, 복사 없음)
+
+        mplfinance.plot에 그대로 전달 가능
+        """
+        return pd.DataFrame(
+            self._values[:, self._start:self._end].T,
+            index=pd.DatetimeIndex(self.dates, name='Date', copy=False),
+            columns=list(self.COLUMNS),
+            copy=False
+        )
@@ -0,0 +1,132 @@
+from datetime import date, timedelta
+from collections import OrderedDict
+
+
+def get_span(start_date, end_date):
+    """시작일~종료일 일수 차이"""
+    return (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days
+
+
+class CandleCache:
+    """
+    종목별 최근 일봉 캐시 (상주 모드에서 알림마다 반복되는 DB 조회 방지)
+
+    - 종목마다 시작일 이후의 일봉을 CandleArray로 보관하고 캔들 저장 시 제자리 갱신
+    - 종목마다 지금까지 요청된 가장 긴 조회 구간(일수)만 유지하고, 날짜가 넘어가면
+      그 구간보다 오래된 행은 앞에서 잘라냄 (상주 모드에서 행 수가 계속 늘지 않음)
+    - 최근에 조회되지 않은 종목부터 제거 (LRU)
+    - 전체 보관 행 수가 max_rows를 넘지 않도록 제한 (메모리 상한)
+
+    조회 결과는 캐시 버퍼를 공유하는 읽기 전용 뷰이므로 이후 같은 날짜 저장이 반영됨
+    (다른 스레드에서 오래 사용할 때는 copy() 후 사용)
+    """
+
+    def __init__(self, max_rows):
+        """
+        Args:
+            max_rows: 전체 종목 합산 최대 보관 행 수
+        """
+        self.max_rows = max_rows
+        self.entries = OrderedDict()
+        self.row_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol, start_date, end_date):
+        """
+        기간 일봉 조회
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            start_date: 시작일 'YYYY-MM-DD' (포함)
+            end_date: 종료일 'YYYY-MM-DD' (포함)
+
+        Returns:
+            CandleArray: 기간 일봉 읽기 전용 뷰
+            None: 캐시에 없거나 시작일이 캐시 범위보다 이전
+        """
+        entry = self.entries.get(symbol)
+        if entry is None or start_date < entry['start_date']:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(symbol)
+        self.hits += 1
+
+        entry['span'] = max(entry['span'], get_span(start_date, end_date))
+        self._trim(entry, end_date)
+        return entry['candles'].window(start_date, end_date)
+
+    def put(self, symbol, start_date, end_date, candles):
+        """
+        DB에서 읽은 시작일 이후 전체 일봉 저장
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            start_date: 시작일 'YYYY-MM-DD'
+            end_date: 조회 종료일 'YYYY-MM-DD' (시작일과의 차이를 유지할 구간으로 사용)
+            candles: 시작일 이후 전체 일봉 CandleArray (수정 가능한 원본)
+        """
+        self.discard(symbol)
+        if len(candles) > self.max_rows:
+            return
+
+        self.entries[symbol] = {
+            'start_date': start_date,
+            'span': get_span(start_date, end_date),
+            'candles': candles
+        }
+        self.row_count += len(candles)
+        self._evict()
+
+    def update(self, symbol, reg_date, open_price, high_price, low_price, close_price, volume):
+        """
+        캔들 저장 반영 (캐시에 있는 종목만)
+
+        마지막 날짜 이후/같은 날짜는 끝에 추가 또는 갱신하고, 중간 날짜는 제자리 갱신
+        (중간에 없던 날짜가 생기면 순서 유지를 위해 종목 캐시 제거)
+        """
+        entry = self.entries.get(symbol)
+        if entry is None or reg_date < entry['start_date']:
+            return
+
+        candles = entry['candles']
+        prices = (open_price, high_price, low_price, close_price, volume)
+
+        if candles.last_date is None or reg_date >= candles.last_date:
+            size = len(candles)
+            candles.append(reg_date, *prices)
+            self.row_count += len(candles) - size
+            self._trim(entry, reg_date)
+            self._evict()
+        elif not candles.set_row(reg_date, *prices):
+            self.discard(symbol)
+
+    def discard(self, symbol):
+        """종목 캐시 제거"""
+        entry = self.entries.pop(symbol, None)
+        if entry is not None:
+            self.row_count -= len(entry['candles'])
+
+    def clear(self):
+        """전체 캐시 제거"""
+        self.entries.clear()
+        self.row_count = 0
+
+    def _trim(self, entry, end_date):
+        """종료일 기준 유지 구간보다 오래된 행 제거"""
+        start_date = (date.fromisoformat(end_date) - timedelta(days=entry['span'])).isoformat()
+        if start_date <= entry['start_date']:
+            return
+
+        candles = entry['candles']
+        size = len(candles)
+        candles.trim(start_date)
+        entry['start_date'] = start_date
+        self.row_count -= size - len(candles)
+
+    def _evict(self):
+        """전체 행 수가 상한 이하가 될 때까지 가장 오래전에 조회한 종목부터 제거"""
+        while self.row_count > self.max_rows and self.entries:
+            _, entry = self.entries.popitem(last=False)
+            self.row_count -= len(entry['candles'])
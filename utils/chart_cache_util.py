@@ -0,0 +1,84 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ChartCache:
+    """
+    차트 이미지 캐시 (같은 입력의 차트를 다시 렌더링하지 않음)
+
+    - 키는 렌더링 입력(종목, 일봉 데이터, 차트 옵션, 시간 구간)의 해시 (make_key)
+    - 시간 구간이 바뀌면 키가 달라지므로 차트에 표시되는 생성 시각은 최대 ttl_seconds만큼만 지연
+    - 최근에 조회되지 않은 항목부터 제거 (LRU, 최대 max_entries개)
+    - 저장 후 ttl_seconds가 지난 항목은 조회 시 만료 처리
+    - 여러 워커 스레드에서 동시에 사용하므로 락으로 보호
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        """
+        Args:
+            max_entries: 최대 보관 이미지 수
+            ttl_seconds: 이미지 보관 시간 (초, 키의 시간 구간 길이로도 사용)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, symbol, candles, options):
+        """
+        렌더링 입력 해시 생성
+
+        Args:
+            symbol: 종목코드
+            candles: 일봉 CandleArray (날짜/OHLCV 값 전체를 해시)
+            options: 차트 옵션 (repr로 해시, 옵션이 바뀌면 다른 키)
+
+        Returns:
+            str: sha256 hex digest
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{symbol}|{options!r}|{int(time.time() // self.ttl_seconds)}".encode())
+        digest.update(candles.dates.tobytes())
+        for column in (candles.open, candles.high, candles.low, candles.close, candles.volume):
+            digest.update(column.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        이미지 조회
+
+        Returns:
+            bytes: PNG 이미지
+            None: 없거나 만료
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self.entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, image):
+        """이미지 저장 (최대 개수를 넘으면 가장 오래전에 조회한 항목부터 제거)"""
+        with self.lock:
+            self.entries[key] = (time.monotonic(), image)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        """적중률 (0~1, 조회가 없으면 0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
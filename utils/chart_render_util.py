@@ -0,0 +1,95 @@
+import os
+import zlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+def _warm_up():
+    """워커 프로세스 기동 확인용 작업 (initializer 실행을 앞당김)"""
+    return os.getpid()
+
+
+class ChartRenderService:
+    """
+    차트 렌더링 프로세스 풀 (matplotlib CPU 작업을 GIL 밖에서 실행)
+
+    - 워커마다 프로세스 1개짜리 풀을 두고 종목 해시로 배정
+      (같은 종목은 항상 같은 워커에서 렌더링되어 워커의 차트 배경 캐시를 재사용)
+    - 생성 시 워커를 미리 띄워 initializer(폰트/스타일 로드)를 첫 알림 전에 실행
+    - 대기 중인 렌더링이 max_pending개 이상이면 새 요청을 받지 않음 (알림 폭주 시 부하 차단)
+    - 워커가 비정상 종료되면 해당 워커 풀만 새로 생성
+    - 부모 프로세스의 스레드/DB 연결을 복제하지 않도록 spawn 방식으로 워커 생성
+    """
+
+    def __init__(self, render_func, workers, max_pending, initializer=None):
+        """
+        Args:
+            render_func: 렌더링 함수 (모듈 최상위 함수, 인자는 (symbol, ...) 형식)
+            workers: 워커 프로세스 수
+            max_pending: 최대 대기 렌더링 수 (전체 워커 합산)
+            initializer: 워커 프로세스 시작 시 한 번 실행할 함수 (폰트/스타일 로드 등)
+        """
+        self.render_func = render_func
+        self.max_pending = max_pending
+        self.initializer = initializer
+        self.context = multiprocessing.get_context('spawn')
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.submitted = 0
+        self.shed = 0
+
+        self.executors = [self._create_executor() for _ in range(workers)]
+        for executor in self.executors:
+            executor.submit(_warm_up)
+
+    def _create_executor(self):
+        return ProcessPoolExecutor(max_workers=1, mp_context=self.context, initializer=self.initializer)
+
+    def submit(self, symbol, *args):
+        """
+        렌더링 요청
+
+        Args:
+            symbol: 종목코드 (워커 배정 기준, render_func 첫 인자로 전달)
+            *args: render_func 나머지 인자 (pickle 가능해야 함)
+
+        Returns:
+            Future: 렌더링 결과
+            None: 대기열이 가득 차서 요청을 받지 않음
+        """
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.shed += 1
+                return None
+            self.pending += 1
+            self.submitted += 1
+
+        index = zlib.crc32(symbol.encode()) % len(self.executors)
+        executor = self.executors[index]
+        try:
+            try:
+                future = executor.submit(self.render_func, symbol, *args)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료된 풀은 다시 사용할 수 없으므로 교체 후 재시도
+                with self.lock:
+                    if self.executors[index] is executor:
+                        self.executors[index] = self._create_executor()
+                    executor = self.executors[index]
+                future = executor.submit(self.render_func, symbol, *args)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self):
+        with self.lock:
+            self.pending -= 1
+
+    def shutdown(self):
+        """워커 종료 (대기 중인 렌더링은 취소)"""
+        for executor in self.executors:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,195 @@
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import mplfinance as mpf
+import matplotlib.pyplot as plt
+import matplotlib.image as mimage
+import matplotlib.font_manager as fm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+class ChartContext:
+    """
+    차트 렌더링 공용 설정 (폰트 등록, rcParams, mplfinance 스타일)
+
+    차트마다 폰트 등록/스타일 생성을 반복하지 않도록 프로세스당 한 번만 준비하여 재사용
+    - 전역 rcParams는 최초 생성 시 한 번만 설정하고 이후에는 변경하지 않음
+    - pyplot 전역 상태(현재 figure, mplfinance가 적용하는 rcParams)를 쓰는 구간은
+      render_lock으로 직렬화하여 동시 렌더링 간 경합 방지
+    """
+    _instance = None
+    _initialized = False
+    _init_lock = threading.Lock()
+
+    def __new__(cls, font_path):
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super(ChartContext, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, font_path):
+        """
+        Args:
+            font_path: 한글 폰트(TTF) 경로 (최초 생성 시에만 사용)
+        """
+        with ChartContext._init_lock:
+            if ChartContext._initialized:
+                return
+
+            # 폰트를 matplotlib 폰트 매니저에 등록
+            fm.fontManager.addfont(font_path)
+            self.font_name = fm.FontProperties(fname=font_path).get_name()
+
+            self.rc = {
+                'font.family': self.font_name,
+                'axes.unicode_minus': False,
+                'axes.formatter.useoffset': False
+            }
+            plt.rcParams.update(self.rc)
+
+            # 차트 스타일 (상승 빨강, 하락 파랑)
+            self.market_colors = mpf.make_marketcolors(up='red', down='blue', inherit=True)
+            self.style = mpf.make_mpf_style(
+                marketcolors=self.market_colors,
+                gridstyle='--',
+                y_on_right=True,
+                rc=self.rc
+            )
+
+            self.render_lock = threading.Lock()
+            ChartContext._initialized = True
+
+
+def make_background_key(symbol, candles, options):
+    """
+    차트 배경 식별 키 (당일 이전 일봉, 당일 날짜, 차트 옵션의 해시)
+
+    당일(마지막) 일봉 값은 포함하지 않으므로 장중 갱신에도 키가 유지됨
+    (일봉이 당일 1개뿐이면 배경에 당일 값이 그려지므로 포함)
+
+    Args:
+        symbol: 종목코드
+        candles: 일봉 CandleArray
+        options: 차트 옵션 (repr로 해시)
+
+    Returns:
+        str: sha256 hex digest
+    """
+    history = candles[:-1] if len(candles) > 1 else candles
+    digest = hashlib.sha256()
+    digest.update(f"{symbol}|{candles.last_date}|{options!r}".encode())
+    digest.update(history.dates.tobytes())
+    for column in (history.open, history.high, history.low, history.close, history.volume):
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+class LiveChart:
+    """
+    배경 래스터를 캐시해 두고 변하는 아티스트만 다시 그리는 차트 (blitting)
+
+    - 생성 시 animated 아티스트를 제외한 figure 전체를 한 번 그려 배경 래스터로 보관
+    - render는 배경을 복원한 뒤 animated 아티스트만 그리고 PNG로 인코딩
+      (savefig의 전체 다시 그리기 없이 변경분만 래스터화)
+    - 출력 영역은 생성 시 계산한 tight bbox로 고정 (savefig(bbox_inches='tight')와 동일한 여백)
+
+    아티스트 데이터 갱신과 render는 같은 락 안에서 호출해야 함 (figure 공유)
+    """
+
+    def __init__(self, key, fig, price_ax, volume_ax, artists, dpi, pad_inches=0.05):
+        """
+        Args:
+            key: 배경 식별 키 (배경 입력이 바뀌면 새로 생성)
+            fig: 배경까지 그려진 figure (pyplot에서 분리하여 보관)
+            price_ax: 가격 축 (가격 범위 확인용)
+            volume_ax: 거래량 축 (거래량 범위 확인용)
+            artists: 매번 다시 그릴 아티스트 {이름: 아티스트} (animated=True로 생성, 이름으로 데이터 갱신)
+            dpi: 출력 해상도
+            pad_inches: tight bbox 여백 (인치)
+        """
+        self.key = key
+        self.fig = fig
+        self.price_ax = price_ax
+        self.volume_ax = volume_ax
+        self.artists = artists
+
+        # pyplot 관리 목록에서 분리하고 Agg 캔버스에 직접 연결 (열린 figure 수 경고/누수 방지)
+        plt.close(fig)
+        fig.set_dpi(dpi)
+        self.canvas = FigureCanvasAgg(fig)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(fig.bbox)
+
+        # tight bbox(인치, 좌하단 원점)를 버퍼 픽셀 범위(좌상단 원점)로 변환
+        bbox = fig.get_tightbbox(self.canvas.get_renderer()).padded(pad_inches)
+        width, height = self.canvas.get_width_height()
+        self.rows = slice(max(0, int(height - bbox.y1 * dpi)), min(height, int(np.ceil(height - bbox.y0 * dpi))))
+        self.cols = slice(max(0, int(bbox.x0 * dpi)), min(width, int(np.ceil(bbox.x1 * dpi))))
+
+    def contains(self, low_price, high_price, volume):
+        """당일 값이 배경의 축 범위 안에 있는지 (벗어나면 배경을 다시 만들어야 함)"""
+        price_low, price_high = self.price_ax.get_ylim()
+        return price_low <= low_price and high_price <= price_high and volume <= self.volume_ax.get_ylim()[1]
+
+    def render(self):
+        """
+        배경 위에 animated 아티스트만 그려 PNG로 인코딩
+
+        Returns:
+            bytes: PNG 이미지
+        """
+        self.canvas.restore_region(self.background)
+        for artist in self.artists.values():
+            artist.axes.draw_artist(artist)
+
+        pixels = np.asarray(self.canvas.buffer_rgba())[self.rows, self.cols]
+        buffer = io.BytesIO()
+        mimage.imsave(buffer, pixels, format='png')
+        return buffer.getvalue()
+
+
+class LiveChartCache:
+    """
+    종목별 LiveChart 보관 (종목당 최신 배경 1개, 최근에 사용하지 않은 종목부터 제거)
+    """
+
+    def __init__(self, max_entries):
+        """
+        Args:
+            max_entries: 최대 보관 종목 수 (figure와 배경 래스터를 보관하므로 메모리 사용량에 비례)
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol, key, low_price, high_price, volume):
+        """
+        배경을 재사용할 수 있는 LiveChart 조회
+
+        Args:
+            symbol: 종목코드
+            key: 배경 식별 키 (make_background_key)
+            low_price, high_price, volume: 당일 저가/고가/거래량 (배경 축 범위 확인용)
+
+        Returns:
+            LiveChart: 배경 재사용 가능
+            None: 없거나 배경 입력이 바뀌었거나 당일 값이 축 범위를 벗어남
+        """
+        chart = self.entries.get(symbol)
+        if chart is None or chart.key != key or not chart.contains(low_price, high_price, volume):
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(symbol)
+        self.hits += 1
+        return chart
+
+    def put(self, symbol, chart):
+        """LiveChart 저장 (같은 종목의 이전 배경은 교체)"""
+        self.entries[symbol] = chart
+        self.entries.move_to_end(symbol)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
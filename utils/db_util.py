@@ -1,74 +1,393 @@
 import sqlite3
+import threading
+from itertools import islice
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import wraps
+
+from utils.candle_array_util import CandleArray
+from utils.candle_cache_util import CandleCache
+from utils.extrema_util import RollingExtrema
+from utils.logger_util import LoggerUtil
+
+logger = LoggerUtil().get_logger()
+
+# 한국 표준시 (reg_date 기준 시간대)
+KST = timezone(timedelta(hours=9))
+
+# 기존 종목별 테이블 접두어 (bp_candles 이관 대상)
+LEGACY_TABLE_PREFIX = 'bp_price_'
+
+# 일괄 삽입 시 executemany 1회에 넘기는 행 수 (메모리 사용량과 호출 오버헤드 절충)
+BULK_INSERT_CHUNK_SIZE = 5000
+
+# 일괄 삽입 중복(symbol, reg_date) 처리 방식별 INSERT 구문
+BULK_INSERT_STATEMENTS = {
+    'ignore': 'INSERT OR IGNORE',   # 기존 레코드 유지
+    'replace': 'INSERT OR REPLACE',  # 새 값으로 교체
+}
+
+# 장중 체결가 봉 집계 단위 (이름: 초)
+TICK_BAR_INTERVALS = {
+    '1m': 60,
+    '1h': 3600,
+}
+
+# 내구성 프로파일별 PRAGMA 설정
+# - safe: 기본 롤백 저널 + 커밋마다 fsync (전원 장애에도 커밋 유실 없음)
+# - balanced: WAL + synchronous=NORMAL (전원 장애 시 마지막 커밋 일부만 유실 가능, 읽기/쓰기 동시 진행)
+# - fast: WAL + synchronous=OFF (OS 장애 시 DB 손상 가능, 재생성 가능한 데이터용)
+DURABILITY_PROFILES = {
+    'safe': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,
+        'temp_store': 'MEMORY',
+    },
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,
+        'temp_store': 'MEMORY',
+    },
+}
+
+
+def get_period_range(days, base_date=None):
+    """
+    N일 기간의 reg_date 범위 계산 (기준일 포함, 기준일 - N일부터)
+
+    reg_date 컬럼에 함수를 씌우지 않고 문자열 범위로 비교하기 위한 경계값
+
+    Args:
+        days: 기간 일수
+        base_date: 기준일 'YYYY-MM-DD' (None이면 KST 오늘)
+
+    Returns:
+        tuple: (시작일, 기준일) 'YYYY-MM-DD'
+    """
+    if base_date is None:
+        base_date = datetime.now(KST).date().isoformat()
+
+    start_date = (date.fromisoformat(base_date) - timedelta(days=days)).isoformat()
+    return start_date, base_date
+
+
+def synchronized(method):
+    """인스턴스 락을 잡고 메서드 실행 (여러 스레드의 DB 접근을 하나의 연결로 직렬화)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DatabaseUtil:
-    def __init__(self, db_path):
+    def __init__(self, db_path, durability='balanced', extrema_periods=(5, 20, 60, 120), cache_max_rows=0,
+                 busy_timeout=5.0):
+        if durability not in DURABILITY_PROFILES:
+            raise ValueError(
+                f"알 수 없는 DB 내구성 프로파일: {durability} "
+                f"(사용 가능: {', '.join(DURABILITY_PROFILES)})"
+            )
+
         self.db_path = db_path
+        self.durability = durability
+        # 다른 연결이 쓰기 잠금을 잡고 있을 때 기다릴 최대 시간 (초)
+        self.busy_timeout = busy_timeout
         self.conn = None
+        self.lock = threading.RLock()
+        # transaction() 중첩 깊이 (0보다 크면 캔들 쓰기 커밋을 미룸)
+        self.transaction_depth = 0
+        # 기간별 최고가/최저가 요약 대상 기간과 종목별 단조 덱 상태
+        self.extrema_periods = sorted(set(extrema_periods))
+        self.rolling_extrema = {}
+        # 종목별 최근 일봉 캐시 (cache_max_rows가 0이면 사용 안 함)
+        self.candle_cache = CandleCache(cache_max_rows) if cache_max_rows > 0 else None
 
+    @synchronized
     def connect(self):
-        """데이터베이스 연결"""
-        self.conn = sqlite3.connect(self.db_path)
+        """데이터베이스 연결 (워커 스레드에서도 사용하므로 스레드 검사 해제)"""
+        self.conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+
+        self.apply_durability_profile()
+        self.create_tables()
+        self.migrate_legacy_tables()
         return True
 
+    @synchronized
     def close(self):
         """연결 종료"""
         if self.conn:
             self.conn.commit()
             self.conn.close()
 
-    def table_exists(self, symbol):
+    @synchronized
+    def apply_durability_profile(self):
         """
-        테이블 존재 여부 확인
-
-        Args:
-            symbol: 'BTC', 'XRP', 'ETH'
+        내구성 프로파일 PRAGMA 적용 (저널 모드, 동기화 수준, mmap/캐시 크기, 임시 저장소)
 
         Returns:
-            bool: 테이블 존재 여부
+            str: 실제 적용된 저널 모드 (메모리 DB 등 WAL 미지원 시 다른 값)
         """
-        table_name = f"bp_price_{symbol.lower()}"
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name=?
-        ''', (table_name,))
-        return cursor.fetchone() is not None
+        profile = DURABILITY_PROFILES[self.durability]
 
-    def create_table(self, symbol):
+        journal_mode = self.conn.execute(f"PRAGMA journal_mode={profile['journal_mode']}").fetchone()[0]
+        self.conn.execute(f"PRAGMA synchronous={profile['synchronous']}")
+        self.conn.execute(f"PRAGMA mmap_size={profile['mmap_size']}")
+        self.conn.execute(f"PRAGMA cache_size={profile['cache_size']}")
+        self.conn.execute(f"PRAGMA temp_store={profile['temp_store']}")
+
+        logger.info(f"DB 내구성 프로파일: {self.durability} (journal_mode={journal_mode}, synchronous={profile['synchronous']})")
+        return journal_mode
+
+    @synchronized
+    def commit(self):
         """
-        종목별 테이블 생성
+        대기 중인 쓰기 즉시 커밋 (transaction() 블록 안에서도 커밋)
 
-        Args:
-            symbol: 'BTC', 'XRP', 'ETH'
+        장시간 열려 있는 transaction() 블록(스트리밍 모드)에서 주기적으로 호출
+        """
+        self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        캔들 쓰기를 하나의 트랜잭션으로 묶는 컨텍스트 매니저 (사이클 단위 커밋용)
+
+        블록 안의 upsert_candle/insert_candle/update_candle은 커밋하지 않고
+        블록을 벗어날 때 한 번에 커밋 (예외 발생 시 롤백)
+        락은 문장 단위로만 잡으므로 블록 안에서 워커 스레드가 함께 쓸 수 있음
+        (같은 인스턴스의 모든 쓰기가 트랜잭션에 합류하므로, 사이클과 무관한 이력 백필은
+        별도 DatabaseUtil 인스턴스(연결)로 실행해야 사이클 롤백에 휩쓸리지 않음)
+        """
+        with self.lock:
+            self.transaction_depth += 1
+
+        try:
+            yield self
+        except BaseException:
+            with self.lock:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.conn.rollback()
+                    # 롤백된 쓰기가 반영됐을 수 있으므로 요약 덱 상태와 일봉 캐시 폐기
+                    self.rolling_extrema.clear()
+                    if self.candle_cache is not None:
+                        self.candle_cache.clear()
+            raise
+        else:
+            with self.lock:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.conn.commit()
+
+    def _commit(self):
+        """transaction() 블록 밖이면 즉시 커밋"""
+        if self.transaction_depth == 0:
+            self.conn.commit()
+
+    @synchronized
+    def create_tables(self):
+        """
+        공용 테이블 생성
+
+        - bp_candles: 전 종목 일봉 캔들, (symbol, reg_date) 복합 기본키의 WITHOUT ROWID 테이블
+          (prev_high_price/prev_low_price: 마지막 UPSERT 직전의 당일 고가/저가)
+        - bp_sync_state: 종목별 이력 동기화 상태
+        - bp_period_extrema: 종목/기간별 최고가/최저가 요약 (base_date 이전 완료 일봉 기준)
+        - bp_ticks: 조회/수신한 체결가 원본 (추가만, 보존 기간이 지나면 봉으로 압축 후 삭제)
+        - bp_tick_bars: 체결가 압축 봉 (1분/1시간)
         """
-        table_name = f"bp_price_{symbol.lower()}"
         cursor = self.conn.cursor()
 
-        # 테이블 생성
-        cursor.execute(f'''
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                idx INTEGER PRIMARY KEY AUTOINCREMENT,
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bp_candles (
+                symbol TEXT NOT NULL,
+                reg_date TEXT NOT NULL,
                 open_price REAL NOT NULL,
                 close_price REAL NOT NULL,
                 high_price REAL NOT NULL,
                 low_price REAL NOT NULL,
                 volume REAL NOT NULL,
-                reg_date TEXT NOT NULL,
-                UNIQUE(reg_date)
+                prev_high_price REAL,
+                prev_low_price REAL,
+                PRIMARY KEY (symbol, reg_date)
+            ) WITHOUT ROWID
+        ''')
+
+        # 이전 버전에서 만든 bp_candles에 직전 고가/저가 컬럼 추가
+        cursor.execute('PRAGMA table_info(bp_candles)')
+        columns = {row['name'] for row in cursor.fetchall()}
+        for column in ('prev_high_price', 'prev_low_price'):
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE bp_candles ADD COLUMN {column} REAL')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bp_sync_state (
+                symbol TEXT PRIMARY KEY,
+                first_date TEXT,
+                history_days INTEGER NOT NULL,
+                synced_date TEXT NOT NULL
             )
         ''')
 
-        # 인덱스 생성
-        cursor.execute(f'''
-            CREATE INDEX IF NOT EXISTS idx_{symbol.lower()}_reg_date
-            ON {table_name}(reg_date DESC)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bp_period_extrema (
+                symbol TEXT NOT NULL,
+                days INTEGER NOT NULL,
+                base_date TEXT NOT NULL,
+                high_price REAL,
+                low_price REAL,
+                PRIMARY KEY (symbol, days)
+            ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bp_ticks (
+                symbol TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                price REAL NOT NULL,
+                PRIMARY KEY (symbol, ts)
+            ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bp_tick_bars (
+                symbol TEXT NOT NULL,
+                interval TEXT NOT NULL,
+                bar_ts INTEGER NOT NULL,
+                open_price REAL NOT NULL,
+                high_price REAL NOT NULL,
+                low_price REAL NOT NULL,
+                close_price REAL NOT NULL,
+                tick_count INTEGER NOT NULL,
+                PRIMARY KEY (symbol, interval, bar_ts)
+            ) WITHOUT ROWID
         ''')
 
         self.conn.commit()
 
-    def bulk_insert_candles(self, symbol, candles):
+    @synchronized
+    def migrate_legacy_tables(self):
+        """
+        종목별 테이블(bp_price_{symbol})을 bp_candles로 이관
+
+        테이블마다 복사와 삭제를 한 트랜잭션으로 처리하므로
+        도중에 중단되어도 다음 연결 시 남은 테이블부터 이어서 이관
+
+        Returns:
+            int: 이관한 테이블 개수
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name LIKE ? ESCAPE '\\'
+        ''', (LEGACY_TABLE_PREFIX.replace('_', '\\_') + '%',))
+        table_names = [row['name'] for row in cursor.fetchall()]
+
+        for table_name in table_names:
+            symbol = table_name[len(LEGACY_TABLE_PREFIX):].upper()
+
+            with self.conn:
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO bp_candles
+                    (symbol, reg_date, open_price, close_price, high_price, low_price, volume)
+                    SELECT ?, reg_date, open_price, close_price, high_price, low_price, volume
+                    FROM {table_name}
+                ''', (symbol,))
+                migrated_count = cursor.rowcount
+                cursor.execute(f'DROP TABLE {table_name}')
+                cursor.execute('DELETE FROM bp_period_extrema WHERE symbol = ?', (symbol,))
+
+            logger.info(f"[{symbol}] {table_name} → bp_candles 이관 완료 ({migrated_count}건)")
+
+        return len(table_names)
+
+    @synchronized
+    def symbol_exists(self, symbol):
+        """
+        종목 데이터 존재 여부 확인
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+
+        Returns:
+            bool: bp_candles에 해당 종목 레코드 존재 여부
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT 1 FROM bp_candles
+            WHERE symbol = ?
+            LIMIT 1
+        ''', (symbol.upper(),))
+        return cursor.fetchone() is not None
+
+    @synchronized
+    def bulk_insert_rows(self, rows, on_conflict='ignore', chunk_size=BULK_INSERT_CHUNK_SIZE):
+        """
+        캔들 행 일괄 삽입 (여러 종목 가능, 전체를 한 트랜잭션으로 커밋)
+
+        행을 chunk_size개씩 나눠 executemany로 삽입하므로 제너레이터를 넘기면
+        전체 행을 메모리에 올리지 않음
+
+        Args:
+            rows: (symbol, reg_date, open_price, close_price, high_price, low_price, volume) 튜플 iterable
+                  symbol은 대문자, reg_date는 'YYYY-MM-DD'
+            on_conflict: 이미 있는 (symbol, reg_date) 처리 방식 ('ignore': 유지, 'replace': 교체)
+            chunk_size: executemany 1회당 행 수
+
+        Returns:
+            int: 삽입(교체 포함)된 행 수
+        """
+        if on_conflict not in BULK_INSERT_STATEMENTS:
+            raise ValueError(
+                f"알 수 없는 중복 처리 방식: {on_conflict} "
+                f"(사용 가능: {', '.join(BULK_INSERT_STATEMENTS)})"
+            )
+
+        query = f'''
+            {BULK_INSERT_STATEMENTS[on_conflict]} INTO bp_candles
+            (symbol, reg_date, open_price, close_price, high_price, low_price, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        '''
+        cursor = self.conn.cursor()
+        rows = iter(rows)
+        symbols = set()
+        inserted = 0
+
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+
+                cursor.executemany(query, chunk)
+                inserted += cursor.rowcount
+                symbols.update(row[0] for row in chunk)
+        except BaseException:
+            if self.transaction_depth == 0:
+                self.conn.rollback()
+            raise
+
+        # 과거 일봉이 추가되므로 요약과 캐시 폐기 (다음 조회 시 재계산)
+        for symbol in symbols:
+            self.invalidate_symbol(symbol)
+        self._commit()
+
+        return inserted
+
+    def bulk_insert_candles(self, symbol, candles, on_conflict='ignore', chunk_size=BULK_INSERT_CHUNK_SIZE):
         """
         캔들 데이터 일괄 삽입 (초기 데이터 로딩용)
 
@@ -86,29 +405,30 @@ class DatabaseUtil:
                     },
                     ...
                 ]
-        """
-        table_name = f"bp_price_{symbol.lower()}"
-        cursor = self.conn.cursor()
+            on_conflict: 이미 있는 날짜 처리 방식 ('ignore': 유지, 'replace': 교체)
+            chunk_size: executemany 1회당 행 수
 
-        for candle in candles:
-            # reg_date를 날짜만 추출 (YYYY-MM-DD)
-            date_only = candle['candle_date_time_kst'][:10]
+        Returns:
+            int: 삽입(교체 포함)된 행 수
+        """
+        symbol = symbol.upper()
 
-            cursor.execute(f'''
-                INSERT INTO {table_name}
-                (open_price, close_price, high_price, low_price, volume, reg_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
+        # reg_date는 날짜만 추출 (YYYY-MM-DD)
+        rows = (
+            (
+                symbol,
+                candle['candle_date_time_kst'][:10],
                 candle['opening_price'],
                 candle['trade_price'],
                 candle['high_price'],
                 candle['low_price'],
-                candle['candle_acc_trade_volume'],
-                date_only
-            ))
-
-        self.conn.commit()
+                candle['candle_acc_trade_volume']
+            )
+            for candle in candles
+        )
+        return self.bulk_insert_rows(rows, on_conflict, chunk_size)
 
+    @synchronized
     def get_record_by_date(self, symbol, date):
         """
         특정 날짜의 레코드 조회
@@ -119,29 +439,186 @@ class DatabaseUtil:
 
         Returns:
             {
-                'idx': int,
+                'symbol': str,
+                'reg_date': str,
                 'open_price': float,
                 'close_price': float,
                 'high_price': float,
                 'low_price': float,
                 'volume': float,
-                'reg_date': str
+                'prev_high_price': float,  # 마지막 UPSERT 직전 고가 (없으면 None)
+                'prev_low_price': float    # 마지막 UPSERT 직전 저가 (없으면 None)
             }
             없으면 None
         """
-        table_name = f"bp_price_{symbol.lower()}"
         cursor = self.conn.cursor()
 
-        cursor.execute(f'''
-            SELECT * FROM {table_name}
-            WHERE reg_date = ?
-        ''', (date,))
+        cursor.execute('''
+            SELECT * FROM bp_candles
+            WHERE symbol = ? AND reg_date = ?
+        ''', (symbol.upper(), date))
 
         result = cursor.fetchone()
         if result:
             return dict(result)
         return None
 
+    @synchronized
+    def get_latest_records(self, symbols=None):
+        """
+        종목별 최신 레코드 일괄 조회
+
+        (symbol, reg_date) 기본키 인덱스로 종목마다 최신 날짜를 찾으므로
+        종목 수와 관계없이 쿼리 한 번으로 처리
+
+        Args:
+            symbols: 조회할 종목 리스트 (None이면 전체 종목)
+
+        Returns:
+            dict: {symbol: get_record_by_date와 같은 형식의 레코드}
+        """
+        cursor = self.conn.cursor()
+
+        query = '''
+            SELECT c.* FROM bp_candles c
+            JOIN (
+                SELECT symbol, MAX(reg_date) AS reg_date
+                FROM bp_candles
+                GROUP BY symbol
+            ) latest
+            ON c.symbol = latest.symbol AND c.reg_date = latest.reg_date
+        '''
+        params = ()
+        if symbols is not None:
+            symbols = [symbol.upper() for symbol in symbols]
+            if not symbols:
+                return {}
+            placeholders = ', '.join('?' for _ in symbols)
+            query += f' WHERE c.symbol IN ({placeholders})'
+            params = tuple(symbols)
+
+        cursor.execute(query, params)
+        return {row['symbol']: dict(row) for row in cursor.fetchall()}
+
+    @synchronized
+    def get_stored_dates(self, symbol, start_date):
+        """
+        특정 날짜 이후 저장된 날짜 목록 조회 (누락 구간 탐색용)
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            start_date: 'YYYY-MM-DD'
+
+        Returns:
+            list: ['YYYY-MM-DD', ...] (오래된 순서)
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute('''
+            SELECT reg_date FROM bp_candles
+            WHERE symbol = ? AND reg_date >= ?
+            ORDER BY reg_date ASC
+        ''', (symbol.upper(), start_date))
+
+        return [row['reg_date'] for row in cursor.fetchall()]
+
+    @synchronized
+    def get_sync_state(self, symbol):
+        """
+        이력 동기화 상태 조회
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+
+        Returns:
+            {
+                'symbol': str,
+                'first_date': str,     # 거래소 보유 데이터 시작일 (모르면 None)
+                'history_days': int,   # 마지막 동기화 시 이력 일수
+                'synced_date': str     # 마지막 동기화 일자 (KST)
+            }
+            없으면 None
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT * FROM bp_sync_state
+            WHERE symbol = ?
+        ''', (symbol.upper(),))
+
+        result = cursor.fetchone()
+        if result:
+            return dict(result)
+        return None
+
+    @synchronized
+    def set_sync_state(self, symbol, first_date, history_days, synced_date):
+        """
+        이력 동기화 상태 저장
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            first_date: 거래소 보유 데이터 시작일 'YYYY-MM-DD' (모르면 None)
+            history_days: 동기화한 이력 일수
+            synced_date: 동기화 일자 'YYYY-MM-DD'
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO bp_sync_state
+            (symbol, first_date, history_days, synced_date)
+            VALUES (?, ?, ?, ?)
+        ''', (symbol.upper(), first_date, history_days, synced_date))
+
+        self._commit()
+
+    @synchronized
+    def upsert_candle(self, symbol, candle):
+        """
+        최신 캔들 저장 (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+
+        조회 없이 문장 하나로 삽입/갱신하고, 갱신 직전의 당일 고가/저가를 함께 반환
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            candle: 일간 캔들 데이터
+
+        Returns:
+            tuple: (직전 고가, 직전 저가)
+                   해당 날짜 첫 저장이면 (None, None)
+        """
+        cursor = self.conn.cursor()
+
+        date_only = candle['candle_date_time_kst'][:10]
+
+        # DO UPDATE의 SET은 갱신 전 값을 참조하므로 기존 고가/저가를 prev 컬럼에 보관
+        cursor.execute('''
+            INSERT INTO bp_candles
+            (symbol, open_price, close_price, high_price, low_price, volume, reg_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(symbol, reg_date) DO UPDATE SET
+                prev_high_price = high_price,
+                prev_low_price = low_price,
+                close_price = excluded.close_price,
+                high_price = excluded.high_price,
+                low_price = excluded.low_price,
+                volume = excluded.volume
+            RETURNING open_price, prev_high_price, prev_low_price
+        ''', (
+            symbol.upper(),
+            candle['opening_price'],
+            candle['trade_price'],
+            candle['high_price'],
+            candle['low_price'],
+            candle['candle_acc_trade_volume'],
+            date_only
+        ))
+        result = cursor.fetchone()
+
+        self.record_rolling_extrema(symbol, date_only, candle['high_price'], candle['low_price'])
+        self._cache_candle(symbol, date_only, result['open_price'], candle)
+        self._commit()
+        return result['prev_high_price'], result['prev_low_price']
+
+    @synchronized
     def insert_candle(self, symbol, candle):
         """
         새로운 날짜 레코드 삽입
@@ -150,16 +627,16 @@ class DatabaseUtil:
             symbol: 'BTC', 'XRP', 'ETH'
             candle: 일간 캔들 데이터
         """
-        table_name = f"bp_price_{symbol.lower()}"
         cursor = self.conn.cursor()
 
         date_only = candle['candle_date_time_kst'][:10]
 
-        cursor.execute(f'''
-            INSERT INTO {table_name}
-            (open_price, close_price, high_price, low_price, volume, reg_date)
-            VALUES (?, ?, ?, ?, ?, ?)
+        cursor.execute('''
+            INSERT INTO bp_candles
+            (symbol, open_price, close_price, high_price, low_price, volume, reg_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (
+            symbol.upper(),
             candle['opening_price'],
             candle['trade_price'],
             candle['high_price'],
@@ -168,8 +645,11 @@ class DatabaseUtil:
             date_only
         ))
 
-        self.conn.commit()
+        self.record_rolling_extrema(symbol, date_only, candle['high_price'], candle['low_price'])
+        self._cache_candle(symbol, date_only, candle['opening_price'], candle)
+        self._commit()
 
+    @synchronized
     def update_candle(self, symbol, candle, date):
         """
         기존 레코드 업데이트
@@ -179,118 +659,451 @@ class DatabaseUtil:
             candle: 일간 캔들 데이터
             date: 'YYYY-MM-DD'
         """
-        table_name = f"bp_price_{symbol.lower()}"
         cursor = self.conn.cursor()
 
-        cursor.execute(f'''
-            UPDATE {table_name}
+        cursor.execute('''
+            UPDATE bp_candles
             SET close_price = ?,
                 high_price = ?,
                 low_price = ?,
                 volume = ?
-            WHERE reg_date = ?
+            WHERE symbol = ? AND reg_date = ?
+            RETURNING open_price
         ''', (
             candle['trade_price'],
             candle['high_price'],
             candle['low_price'],
             candle['candle_acc_trade_volume'],
+            symbol.upper(),
             date
         ))
 
-        self.conn.commit()
+        result = cursor.fetchone()
+
+        if result is not None:
+            self.record_rolling_extrema(symbol, date, candle['high_price'], candle['low_price'])
+            self._cache_candle(symbol, date, result['open_price'], candle)
+        self._commit()
 
-    def get_period_high(self, symbol, days):
+    @synchronized
+    def record_rolling_extrema(self, symbol, reg_date, high_price, low_price):
         """
-        N일 기준 최고가 조회
+        캔들 쓰기를 기간별 최고가/최저가 요약에 반영
+
+        요약 기준일 이후(진행 중) 일봉은 덱 상태에만 보관하고,
+        기준일 이전 일봉이 바뀌면 해당 종목 요약을 폐기
+        """
+        symbol = symbol.upper()
+        state = self.rolling_extrema.get(symbol)
+        if state is not None and state.record(reg_date, high_price, low_price):
+            return
+
+        self.rolling_extrema.pop(symbol, None)
+        self.conn.execute('''
+            DELETE FROM bp_period_extrema
+            WHERE symbol = ? AND base_date > ?
+        ''', (symbol, reg_date))
+
+    @synchronized
+    def invalidate_rolling_extrema(self, symbol):
+        """기간별 최고가/최저가 요약 폐기 (다음 get_rolling_extrema 호출 시 재계산)"""
+        symbol = symbol.upper()
+        self.rolling_extrema.pop(symbol, None)
+        self.conn.execute('DELETE FROM bp_period_extrema WHERE symbol = ?', (symbol,))
+
+    @synchronized
+    def invalidate_symbol(self, symbol):
+        """
+        종목의 요약과 일봉 캐시 폐기 후 커밋 (과거 일봉이 추가된 경우)
+
+        다른 연결(이력 백필)이 과거 일봉을 삽입한 뒤에도 이 인스턴스에서 호출하여
+        메모리에 남은 요약/캐시가 재사용되지 않도록 함
+        """
+        self.invalidate_rolling_extrema(symbol)
+        if self.candle_cache is not None:
+            self.candle_cache.discard(symbol.upper())
+        self._commit()
+
+    @synchronized
+    def get_rolling_extrema(self, symbol, base_date=None):
+        """
+        기간별 최고가/최저가 요약 조회 (기준일 당일 제외, 기간은 extrema_periods)
+
+        - 요약 기준일이 같으면 bp_period_extrema 기본키 조회만 수행
+        - 기준일이 넘어갔으면 메모리의 단조 덱을 이동시켜 갱신 (일봉당 분할 상환 O(1))
+        - 덱 상태가 없거나 요약이 폐기됐으면 가장 긴 기간의 일봉으로 다시 구성
 
         Args:
             symbol: 'BTC', 'XRP', 'ETH'
-            days: 5, 20, 60, 120
+            base_date: 기준일 'YYYY-MM-DD' (캔들의 KST 날짜, None이면 KST 오늘)
 
         Returns:
-            float: N일간 high_price 중 최고값
-            None: 데이터 없음
+            dict: {days: {'high': float 또는 None, 'low': float 또는 None}}
         """
-        table_name = f"bp_price_{symbol.lower()}"
+        symbol = symbol.upper()
+        if base_date is None:
+            base_date = datetime.now(KST).date().isoformat()
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT days, base_date, high_price, low_price
+            FROM bp_period_extrema
+            WHERE symbol = ?
+        ''', (symbol,))
+        rows = {row['days']: row for row in cursor.fetchall()}
+
+        stored_base_date = None
+        if rows and all(days in rows for days in self.extrema_periods):
+            stored_base_dates = {rows[days]['base_date'] for days in self.extrema_periods}
+            if len(stored_base_dates) == 1:
+                stored_base_date = stored_base_dates.pop()
+
+        if stored_base_date == base_date:
+            return {
+                days: {'high': rows[days]['high_price'], 'low': rows[days]['low_price']}
+                for days in self.extrema_periods
+            }
+
+        state = self.rolling_extrema.get(symbol)
+        if state is None or state.base_date != stored_base_date or base_date < state.base_date:
+            state = self._load_rolling_extrema(symbol, base_date)
+        else:
+            state.advance(base_date)
+
+        extrema = state.get()
+        cursor.execute('DELETE FROM bp_period_extrema WHERE symbol = ?', (symbol,))
+        cursor.executemany('''
+            INSERT INTO bp_period_extrema
+            (symbol, days, base_date, high_price, low_price)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (symbol, days, base_date, extrema[days]['high'], extrema[days]['low'])
+            for days in self.extrema_periods
+        ])
+        self._commit()
+
+        return extrema
+
+    def _load_rolling_extrema(self, symbol, base_date):
+        """가장 긴 기간의 일봉을 읽어 종목의 단조 덱 상태 구성 (기준일 이후 일봉은 진행 중으로 보관)"""
+        start_date = get_period_range(self.extrema_periods[-1], base_date)[0]
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT reg_date, high_price, low_price
+            FROM bp_candles
+            WHERE symbol = ? AND reg_date >= ?
+            ORDER BY reg_date ASC
+        ''', (symbol, start_date))
+
+        state = RollingExtrema(self.extrema_periods)
+        for row in cursor.fetchall():
+            if row['reg_date'] < base_date:
+                state.push(row['reg_date'], row['high_price'], row['low_price'])
+            else:
+                state.record(row['reg_date'], row['high_price'], row['low_price'])
+        state.advance(base_date)
+
+        self.rolling_extrema[symbol] = state
+        return state
+
+    def _cache_candle(self, symbol, reg_date, open_price, candle):
+        """저장한 캔들을 일봉 캐시에 반영 (캐시에 있는 종목만)"""
+        if self.candle_cache is None:
+            return
+
+        self.candle_cache.update(
+            symbol.upper(),
+            reg_date,
+            open_price,
+            candle['high_price'],
+            candle['low_price'],
+            candle['trade_price'],
+            candle['candle_acc_trade_volume']
+        )
+
+    def _get_cached_candles(self, symbol, start_date, base_date):
+        """
+        일봉 캐시에서 기간 캔들 조회 (캐시에 없으면 시작일 이후 전체를 DB에서 읽어 캐시에 저장)
+
+        Returns:
+            CandleArray: 기간 일봉 뷰, 캐시를 사용하지 않으면 None
+        """
+        if self.candle_cache is None:
+            return None
+
+        candles = self.candle_cache.get(symbol, start_date, base_date)
+        if candles is not None:
+            return candles
+
+        # 이후 저장되는 당일 캔들도 캐시에서 갱신되도록 종료일 없이 로딩
+        candles = self._select_candles(symbol, start_date)
+        self.candle_cache.put(symbol, start_date, base_date, candles)
+        return candles.window(start_date, base_date)
+
+    def _select_candles(self, symbol, start_date, end_date=None):
+        """DB에서 기간 캔들을 CandleArray로 조회 (end_date가 없으면 끝까지)"""
+        cursor = self.conn.cursor()
+
+        if end_date is None:
+            cursor.execute('''
+                SELECT reg_date, open_price, high_price, low_price, close_price, volume
+                FROM bp_candles
+                WHERE symbol = ? AND reg_date >= ?
+                ORDER BY reg_date ASC
+            ''', (symbol, start_date))
+        else:
+            cursor.execute('''
+                SELECT reg_date, open_price, high_price, low_price, close_price, volume
+                FROM bp_candles
+                WHERE symbol = ? AND reg_date >= ? AND reg_date <= ?
+                ORDER BY reg_date ASC
+            ''', (symbol, start_date, end_date))
+
+        return CandleArray.from_rows(cursor.fetchall())
+
+    @synchronized
+    def get_period_extrema(self, symbol, periods, base_date=None, exclude_base_date=False):
+        """
+        여러 기간의 최고가/최저가를 쿼리 한 번으로 조회 (조건부 집계)
+
+        가장 긴 기간의 reg_date 범위를 한 번만 읽으면서 기간별 CASE 집계
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            periods: 기간 일수 리스트 (예: [5, 20, 60, 120])
+            base_date: 기준일 'YYYY-MM-DD' (캔들의 KST 날짜, None이면 KST 오늘)
+            exclude_base_date: True면 기준일 레코드 제외 (갱신 전 당일 값을 따로 합칠 때 사용)
+
+        Returns:
+            dict: {days: {'high': float 또는 None, 'low': float 또는 None}}
+        """
+        symbol = symbol.upper()
+        periods = sorted(set(periods))
+        start_dates = {days: get_period_range(days, base_date)[0] for days in periods}
+        start_date, base_date = get_period_range(periods[-1], base_date)
+
+        cached_candles = self._get_cached_candles(symbol, start_date, base_date)
+        if cached_candles is not None:
+            if exclude_base_date and cached_candles.last_date == base_date:
+                cached_candles = cached_candles[:-1]
+
+            extrema = {}
+            for days in periods:
+                window = cached_candles.window(start_dates[days])
+                extrema[days] = {
+                    'high': float(window.high.max()) if len(window) else None,
+                    'low': float(window.low.min()) if len(window) else None
+                }
+            return extrema
+
+        end_operator = '<' if exclude_base_date else '<='
+
+        columns = []
+        params = []
+        for index, days in enumerate(periods):
+            columns.append(f'MAX(CASE WHEN reg_date >= ? THEN high_price END) AS high_{index}')
+            columns.append(f'MIN(CASE WHEN reg_date >= ? THEN low_price END) AS low_{index}')
+            params.extend([start_dates[days], start_dates[days]])
 
         cursor = self.conn.cursor()
         cursor.execute(f'''
-            SELECT MAX(high_price) as max_price
-            FROM {table_name}
-            WHERE DATE(reg_date) >= DATE('now', '-{days} days')
-        ''')
+            SELECT {', '.join(columns)}
+            FROM bp_candles
+            WHERE symbol = ? AND reg_date >= ? AND reg_date {end_operator} ?
+        ''', (*params, symbol, start_date, base_date))
 
         result = cursor.fetchone()
-        return result['max_price'] if result and result['max_price'] else None
+        return {
+            days: {'high': result[f'high_{index}'], 'low': result[f'low_{index}']}
+            for index, days in enumerate(periods)
+        }
 
-    def get_period_low(self, symbol, days):
+    def get_period_high(self, symbol, days, base_date=None, exclude_base_date=False):
+        """
+        N일 기준 최고가 조회
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            days: 5, 20, 60, 120
+            base_date: 기준일 'YYYY-MM-DD' (캔들의 KST 날짜, None이면 KST 오늘)
+            exclude_base_date: True면 기준일 레코드 제외
+
+        Returns:
+            float: N일간 high_price 중 최고값
+            None: 데이터 없음
+        """
+        return self.get_period_extrema(symbol, [days], base_date, exclude_base_date)[days]['high']
+
+    def get_period_low(self, symbol, days, base_date=None, exclude_base_date=False):
         """
         N일 기준 최저가 조회
 
         Args:
             symbol: 'BTC', 'XRP', 'ETH'
             days: 5, 20, 60, 120
+            base_date: 기준일 'YYYY-MM-DD' (캔들의 KST 날짜, None이면 KST 오늘)
+            exclude_base_date: True면 기준일 레코드 제외
 
         Returns:
             float: N일간 low_price 중 최저값
             None: 데이터 없음
         """
-        table_name = f"bp_price_{symbol.lower()}"
+        return self.get_period_extrema(symbol, [days], base_date, exclude_base_date)[days]['low']
+
+    @synchronized
+    def get_period_candles(self, symbol, days, base_date=None):
+        """
+        N일 기간의 캔들 데이터 조회 (차트 생성 및 이동평균 계산용)
+
+        일봉 캐시를 사용하면 캐시 버퍼를 공유하는 읽기 전용 뷰 반환
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            days: 조회할 일수 (예: 300)
+            base_date: 기준일 'YYYY-MM-DD' (캔들의 KST 날짜, None이면 KST 오늘)
+
+        Returns:
+            CandleArray: 기간 일봉 (오래된 순서, 데이터가 없으면 길이 0)
+        """
+        symbol = symbol.upper()
+        start_date, base_date = get_period_range(days, base_date)
+
+        cached_candles = self._get_cached_candles(symbol, start_date, base_date)
+        if cached_candles is not None:
+            return cached_candles
+
+        return self._select_candles(symbol, start_date, base_date)
+
+    @synchronized
+    def insert_tick(self, symbol, ts, price):
+        """
+        체결가 기록 (같은 시각 중복은 무시)
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            ts: 체결 시각 (epoch 밀리초)
+            price: 체결가
+        """
+        self.conn.execute('''
+            INSERT OR IGNORE INTO bp_ticks (symbol, ts, price)
+            VALUES (?, ?, ?)
+        ''', (symbol.upper(), int(ts), price))
+        self._commit()
 
+    @synchronized
+    def compact_ticks(self, symbol, tick_cutoff, bar_cutoffs):
+        """
+        보존 기간이 지난 체결가를 1분/1시간 봉으로 압축한 뒤 삭제하고, 오래된 봉 정리
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            tick_cutoff: 이 시각(epoch 밀리초) 이전 체결가를 압축 (봉이 나뉘지 않도록 정시 권장)
+            bar_cutoffs: {'1m': epoch 초, '1h': epoch 초} 이 시각 이전 봉 삭제
+
+        Returns:
+            int: 압축 후 삭제한 체결가 수
+        """
+        symbol = symbol.upper()
         cursor = self.conn.cursor()
-        cursor.execute(f'''
-            SELECT MIN(low_price) as min_price
-            FROM {table_name}
-            WHERE DATE(reg_date) >= DATE('now', '-{days} days')
-        ''')
 
-        result = cursor.fetchone()
-        return result['min_price'] if result and result['min_price'] else None
+        cursor.execute('''
+            SELECT MIN(ts) AS oldest_ts FROM bp_ticks
+            WHERE symbol = ?
+        ''', (symbol,))
+        oldest_ts = cursor.fetchone()['oldest_ts']
+
+        compacted = 0
+        if oldest_ts is not None and oldest_ts < tick_cutoff:
+            for interval, seconds in TICK_BAR_INTERVALS.items():
+                bucket = seconds * 1000
+
+                # 이미 있는 봉(이전 압축분)과는 고가/저가/종가/건수를 합침
+                cursor.execute('''
+                    INSERT INTO bp_tick_bars
+                    (symbol, interval, bar_ts, open_price, high_price, low_price, close_price, tick_count)
+                    SELECT ?, ?, bucket * ? / 1000, open_price, high_price, low_price, close_price, tick_count
+                    FROM (
+                        SELECT
+                            ts / ? AS bucket,
+                            FIRST_VALUE(price) OVER bucket_window AS open_price,
+                            MAX(price) OVER bucket_window AS high_price,
+                            MIN(price) OVER bucket_window AS low_price,
+                            LAST_VALUE(price) OVER bucket_window AS close_price,
+                            COUNT(*) OVER bucket_window AS tick_count,
+                            ROW_NUMBER() OVER (PARTITION BY ts / ? ORDER BY ts) AS row_number
+                        FROM bp_ticks
+                        WHERE symbol = ? AND ts < ?
+                        WINDOW bucket_window AS (
+                            PARTITION BY ts / ? ORDER BY ts
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+                        )
+                    )
+                    WHERE row_number = 1
+                    ON CONFLICT(symbol, interval, bar_ts) DO UPDATE SET
+                        high_price = MAX(high_price, excluded.high_price),
+                        low_price = MIN(low_price, excluded.low_price),
+                        close_price = excluded.close_price,
+                        tick_count = tick_count + excluded.tick_count
+                ''', (symbol, interval, bucket, bucket, bucket, symbol, tick_cutoff, bucket))
+
+            cursor.execute('''
+                DELETE FROM bp_ticks
+                WHERE symbol = ? AND ts < ?
+            ''', (symbol, tick_cutoff))
+            compacted = cursor.rowcount
+
+        for interval, bar_cutoff in bar_cutoffs.items():
+            cursor.execute('''
+                DELETE FROM bp_tick_bars
+                WHERE symbol = ? AND interval = ? AND bar_ts < ?
+            ''', (symbol, interval, bar_cutoff))
 
-    def get_period_candles(self, symbol, days):
+        self._commit()
+        return compacted
+
+    @synchronized
+    def get_ticks(self, symbol, start_ts, end_ts=None):
         """
-        N일 기간의 캔들 데이터 조회 (차트 생성 및 이동평균 계산용)
+        체결가 조회 (장중 차트/사후 분석용, 보존 기간 이내만 존재)
 
         Args:
             symbol: 'BTC', 'XRP', 'ETH'
-            days: 조회할 일수 (예: 300)
+            start_ts: 시작 시각 (epoch 밀리초, 포함)
+            end_ts: 종료 시각 (epoch 밀리초, 미포함, None이면 끝까지)
 
         Returns:
-            list: 캔들 데이터 리스트 (오래된 순서)
-                [
-                    {
-                        'opening_price': float,
-                        'trade_price': float,
-                        'high_price': float,
-                        'low_price': float,
-                        'candle_acc_trade_volume': float,
-                        'candle_date_time_kst': 'YYYY-MM-DD 00:00:00'
-                    },
-                    ...
-                ]
-            빈 리스트: 데이터 없음
+            list: [(ts, price), ...] (오래된 순서)
         """
-        table_name = f"bp_price_{symbol.lower()}"
         cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT ts, price FROM bp_ticks
+            WHERE symbol = ? AND ts >= ? AND ts < ?
+            ORDER BY ts ASC
+        ''', (symbol.upper(), start_ts, end_ts if end_ts is not None else 2 ** 62))
 
-        cursor.execute(f'''
-            SELECT open_price, close_price, high_price, low_price, volume, reg_date
-            FROM {table_name}
-            WHERE DATE(reg_date) >= DATE('now', '-{days} days')
-            ORDER BY reg_date ASC
-        ''')
+        return [(row['ts'], row['price']) for row in cursor.fetchall()]
 
-        results = cursor.fetchall()
+    @synchronized
+    def get_tick_bars(self, symbol, interval, start_ts, end_ts=None):
+        """
+        체결가 압축 봉 조회
+
+        Args:
+            symbol: 'BTC', 'XRP', 'ETH'
+            interval: '1m' 또는 '1h'
+            start_ts: 시작 시각 (epoch 초, 포함)
+            end_ts: 종료 시각 (epoch 초, 미포함, None이면 끝까지)
 
-        candles = []
-        for row in results:
-            candles.append({
-                'opening_price': row['open_price'],
-                'trade_price': row['close_price'],  # close_price를 trade_price로 매핑
-                'high_price': row['high_price'],
-                'low_price': row['low_price'],
-                'candle_acc_trade_volume': row['volume'],
-                'candle_date_time_kst': f"{row['reg_date']} 00:00:00"  # 날짜 형식 맞추기
-            })
+        Returns:
+            list: [{'bar_ts', 'open_price', 'high_price', 'low_price', 'close_price', 'tick_count'}, ...]
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT bar_ts, open_price, high_price, low_price, close_price, tick_count
+            FROM bp_tick_bars
+            WHERE symbol = ? AND interval = ? AND bar_ts >= ? AND bar_ts < ?
+            ORDER BY bar_ts ASC
+        ''', (symbol.upper(), interval, start_ts, end_ts if end_ts is not None else 2 ** 62))
 
-        return candles
+        return [dict(row) for row in cursor.fetchall()]
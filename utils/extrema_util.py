@@ -0,0 +1,91 @@
+from collections import deque
+from datetime import date, timedelta
+
+
+class RollingExtrema:
+    """
+    종목 하나의 기간별 최고가/최저가를 단조 덱(monotonic deque)으로 유지
+
+    기준일 이전에 완료된 일봉만 집계하고, 기준일 이후(진행 중) 일봉은
+    날짜별 최신 값만 보관했다가 기준일이 넘어갈 때 덱에 추가
+    - 기간마다 고가는 내림차순, 저가는 오름차순 덱 유지 (맨 앞이 기간 최고가/최저가)
+    - 기준일 이동 시 기간을 벗어난 일봉을 앞에서 제거 (일봉당 분할 상환 O(1))
+    """
+
+    def __init__(self, periods):
+        """
+        Args:
+            periods: 기간 일수 리스트 (예: [5, 20, 60, 120])
+        """
+        self.periods = sorted(set(periods))
+        self.base_date = None
+        self.high_deques = {days: deque() for days in self.periods}
+        self.low_deques = {days: deque() for days in self.periods}
+        self.pending = {}
+
+    def push(self, reg_date, high_price, low_price):
+        """
+        완료된 일봉 추가 (날짜 오름차순으로만 호출)
+
+        Args:
+            reg_date: 'YYYY-MM-DD'
+            high_price: 고가
+            low_price: 저가
+        """
+        for days in self.periods:
+            high_deque = self.high_deques[days]
+            while high_deque and high_deque[-1][1] <= high_price:
+                high_deque.pop()
+            high_deque.append((reg_date, high_price))
+
+            low_deque = self.low_deques[days]
+            while low_deque and low_deque[-1][1] >= low_price:
+                low_deque.pop()
+            low_deque.append((reg_date, low_price))
+
+    def record(self, reg_date, high_price, low_price):
+        """
+        캔들 쓰기 반영
+
+        Returns:
+            bool: 반영했으면 True, 기준일 이전 날짜라 덱을 다시 만들어야 하면 False
+        """
+        if self.base_date is not None and reg_date < self.base_date:
+            return False
+
+        self.pending[reg_date] = (high_price, low_price)
+        return True
+
+    def advance(self, base_date):
+        """
+        기준일 이동 (기준일 이전 진행 중 일봉을 완료 처리하고 기간을 벗어난 일봉 제거)
+
+        Args:
+            base_date: 새 기준일 'YYYY-MM-DD'
+        """
+        for reg_date in sorted(d for d in self.pending if d < base_date):
+            self.push(reg_date, *self.pending.pop(reg_date))
+
+        self.base_date = base_date
+        base = date.fromisoformat(base_date)
+
+        for days in self.periods:
+            start_date = (base - timedelta(days=days)).isoformat()
+            for price_deque in (self.high_deques[days], self.low_deques[days]):
+                while price_deque and price_deque[0][0] < start_date:
+                    price_deque.popleft()
+
+    def get(self):
+        """
+        기준일 기준 기간별 최고가/최저가 조회 (기준일 당일 제외)
+
+        Returns:
+            dict: {days: {'high': float 또는 None, 'low': float 또는 None}}
+        """
+        return {
+            days: {
+                'high': self.high_deques[days][0][1] if self.high_deques[days] else None,
+                'low': self.low_deques[days][0][1] if self.low_deques[days] else None
+            }
+            for days in self.periods
+        }
@@ -0,0 +1,34 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpUtil:
+    """
+    공용 HTTP 세션 (빗썸/텔레그램 호출이 keep-alive 연결 풀을 공유)
+
+    매 요청마다 DNS 조회, TCP/TLS 핸드셰이크를 다시 하지 않도록
+    프로세스 전체에서 하나의 requests.Session을 재사용
+    """
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, pool_size=1):
+        if cls._instance is None:
+            cls._instance = super(HttpUtil, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, pool_size=1):
+        """
+        Args:
+            pool_size: 호스트별 연결 풀 크기 (동시에 나가는 요청 수, 최초 생성 시에만 사용)
+        """
+        if not HttpUtil._initialized:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+            HttpUtil._initialized = True
+
+    def get_session(self):
+        return self.session
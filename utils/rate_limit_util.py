@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식 요청 속도 제한 (프로세스 전역 공유, 스레드/asyncio 공용)
+
+    초당 rate개의 토큰이 채워지고 요청마다 1개씩 소모.
+    토큰이 없으면 다음 토큰이 채워질 때까지 대기
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 버킷 최대 크기 (기본값: rate, 최소 1)
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        토큰 1개 예약
+
+        Returns:
+            float: 요청 전 대기해야 할 시간(초)
+        """
+        with self.lock:
+            now = time.monotonic()
+
+            # 경과 시간만큼 토큰 충전 (backoff 중이면 재개 시각까지 충전하지 않음)
+            if now > self.updated_at:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+            self.tokens -= 1
+            wait = (self.updated_at - now) + max(0.0, -self.tokens) / self.rate
+            return max(0.0, wait)
+
+    def acquire(self):
+        """토큰 1개 획득 (필요 시 대기)"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """토큰 1개 획득 (asyncio 버전)"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def backoff(self, seconds):
+        """
+        HTTP 429 응답 시 호출 - 버킷을 비우고 지정 시간 동안 토큰 충전 중단
+
+        Args:
+            seconds: 요청 재개까지 대기 시간(초)
+        """
+        with self.lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self.updated_at:
+                self.updated_at = resume_at
+            self.tokens = min(self.tokens, 0.0)
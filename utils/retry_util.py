@@ -0,0 +1,136 @@
+import random
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+    def __init__(self, host):
+        super().__init__(f"회로 차단 중 ({host}) - 요청 생략")
+        self.host = host
+
+
+class RetryPolicy:
+    """
+    지수 백오프 + 지터 재시도 정책
+
+    attempt번째 재시도 대기 시간은 0 ~ min(max_delay, base_delay * 2^attempt) 사이 난수(full jitter).
+    총 소요 시간이 budget초를 넘게 되는 재시도는 하지 않음
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.2, max_delay=2.0, budget=3.0):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 대기 상한(초)
+            max_delay: 재시도 대기 상한(초)
+            budget: 첫 시도부터 전체 허용 시간(초)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+
+    def get_delay(self, attempt):
+        """attempt번째(0부터) 재시도 전 대기 시간(초)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def can_retry(self, attempt, started_at, delay):
+        """
+        재시도 가능 여부
+
+        Args:
+            attempt: 지금까지 실패한 시도 횟수
+            started_at: 첫 시도 시각 (time.monotonic)
+            delay: 재시도 전 대기할 시간(초)
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return time.monotonic() + delay - started_at <= self.budget
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기
+
+    - closed: 정상. 연속 실패가 failure_threshold회에 도달하면 open
+    - open: reset_timeout초 동안 모든 요청 즉시 실패
+    - half_open: reset_timeout 경과 후 시험 요청 1건만 허용, 성공하면 closed / 실패하면 다시 open
+      (시험 요청 결과가 reset_timeout 동안 기록되지 않으면 시험 요청 1건을 다시 허용)
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_started_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """요청 허용 여부 (open 상태에서 reset_timeout이 지나면 시험 요청 1건 허용)"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.trial_started_at = now
+                return True
+
+            # 시험 요청이 성공/실패 기록 없이 끝난 경우 half_open에 머물지 않도록 다시 시험
+            if self.state == self.HALF_OPEN and now - self.trial_started_at >= self.reset_timeout:
+                self.trial_started_at = now
+                return True
+
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """
+        실패 기록
+
+        Returns:
+            bool: 이번 실패로 회로가 열렸으면 True
+        """
+        with self.lock:
+            self.failures += 1
+
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                was_open = self.state == self.OPEN
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return not was_open
+
+            return False
+
+
+class ApiStats:
+    """호스트별 API 호출 통계 (요청/성공/실패/재시도/차단 횟수)"""
+
+    KEYS = ('requests', 'successes', 'failures', 'retries', 'short_circuited')
+
+    def __init__(self):
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def record(self, host, key):
+        with self.lock:
+            host_counts = self.counts.setdefault(host, dict.fromkeys(self.KEYS, 0))
+            host_counts[key] += 1
+
+    def snapshot(self):
+        """{host: {key: count}} 복사본 반환"""
+        with self.lock:
+            return {host: dict(host_counts) for host, host_counts in self.counts.items()}
@@ -1,44 +1,74 @@
 import os
-from urllib.request import urlopen
-import urllib.parse
-import requests
+import aiohttp
 from dotenv import load_dotenv
 import json
 
+from utils.http_util import HttpUtil
+
 load_dotenv()
 
+# 메모리 이미지(bytes) 업로드 시 사용할 파일명
+PHOTO_FILENAME = 'chart.png'
+
 class TelegramUtil:
-    def __init__(self):
+    def __init__(self, timeout=10):
+        """
+        Args:
+            timeout: 동기 요청 타임아웃 (초, 공용 세션 요청이 응답 없이 멈추지 않도록 모든 호출에 적용)
+        """
+        self.timeout = timeout
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.chat_test_id = os.getenv('TELEGRAM_CHAT_TEST_ID')
+        self.session = HttpUtil().get_session()
 
     def send_message(self, message):
         """일반 메시지 전송"""
-        message = urllib.parse.quote_plus(message)
-        urlopen(f"https://api.telegram.org/bot{self.bot_token}/sendMessage?chat_id={self.chat_id}&parse_mode=html&text={message}")
+        self._send_message(self.chat_id, message)
+
+    def send_photo(self, photo, caption=""):
+        """
+        이미지 전송
 
-    def send_photo(self, photo_path, caption=""):
-        """이미지 전송"""
+        Args:
+            photo: 이미지 파일 경로 또는 이미지 bytes (메모리 렌더링 결과)
+            caption: 캡션 (html)
+        """
         url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
-        
-        with open(photo_path, 'rb') as photo:
-            payload = {
-                "chat_id": self.chat_id,
-                "caption": caption,
-                "parse_mode": "html"
-            }
+        payload = {
+            "chat_id": self.chat_id,
+            "caption": caption,
+            "parse_mode": "html"
+        }
+
+        if isinstance(photo, (bytes, bytearray)):
             files = {
-                "photo": photo
+                "photo": (PHOTO_FILENAME, photo, "image/png")
             }
-            response = requests.post(url, data=payload, files=files)
-        
+            response = self.session.post(url, data=payload, files=files, timeout=self.timeout)
+        else:
+            with open(photo, 'rb') as photo_file:
+                files = {
+                    "photo": photo_file
+                }
+                response = self.session.post(url, data=payload, files=files, timeout=self.timeout)
+
         return response.json()
 
     def send_test_message(self, message):
         """테스트용 채팅방으로 메시지 전송"""
-        message = urllib.parse.quote_plus(message)
-        urlopen(f"https://api.telegram.org/bot{self.bot_token}/sendMessage?chat_id={self.chat_test_id}&parse_mode=html&text={message}") 
+        self._send_message(self.chat_test_id, message)
+
+    def _send_message(self, chat_id, message):
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        params = {
+            "chat_id": chat_id,
+            "parse_mode": "html",
+            "text": message
+        }
+
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
     
     def send_multiple_photo(self, photo_paths, caption=""):
         """여러 장의 이미지 한 번에 전송"""
@@ -67,7 +97,7 @@ class TelegramUtil:
                 'media': json.dumps(media)
             }
             
-            response = requests.post(url, data=payload, files=files)
+            response = self.session.post(url, data=payload, files=files, timeout=self.timeout)
             for file in files.values():
                 file.close()
             
@@ -77,4 +107,49 @@ class TelegramUtil:
             # 에러 발생시에도 파일들을 확실히 닫아줌
             for file in files.values():
                 file.close()
-            raise e 
\ No newline at end of file
+            raise e
+
+    async def send_message_async(self, session, message):
+        """일반 메시지 전송 (비동기, aiohttp 세션 사용)"""
+        await self._send_message_async(session, self.chat_id, message)
+
+    async def send_test_message_async(self, session, message):
+        """테스트용 채팅방으로 메시지 전송 (비동기, aiohttp 세션 사용)"""
+        await self._send_message_async(session, self.chat_test_id, message)
+
+    async def _send_message_async(self, session, chat_id, message):
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        params = {
+            "chat_id": chat_id,
+            "parse_mode": "html",
+            "text": message
+        }
+
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+
+    async def send_photo_async(self, session, photo, caption=""):
+        """
+        이미지 전송 (비동기, aiohttp 세션 사용)
+
+        Args:
+            photo: 이미지 파일 경로 또는 이미지 bytes (메모리 렌더링 결과)
+            caption: 캡션 (html)
+        """
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
+
+        form = aiohttp.FormData()
+        form.add_field("chat_id", str(self.chat_id))
+        form.add_field("caption", caption)
+        form.add_field("parse_mode", "html")
+
+        if isinstance(photo, (bytes, bytearray)):
+            form.add_field("photo", photo, filename=PHOTO_FILENAME, content_type="image/png")
+            async with session.post(url, data=form) as response:
+                return await response.json()
+
+        with open(photo, 'rb') as photo_file:
+            form.add_field("photo", photo_file, filename=os.path.basename(photo))
+
+            async with session.post(url, data=form) as response:
+                return await response.json()